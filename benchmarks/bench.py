@@ -0,0 +1,263 @@
+"""End-to-end benchmarks of pep8radius over synthetic repositories.
+
+For each version control system this creates a repository with the given
+number of files (of the given number of lines) and commits of history, then
+makes uncommitted changes (hunks) to each file which need fixing. It times
+each stage of pep8radius separately:
+
+- init: Radius.__init__ (finding the vcs, the branch point and the files)
+- get_filenames_diff: the files which have been changed
+- modified_lines: the lines of each file which have been changed
+- fix_code: fixing the modified lines of each file
+- get_diff: the diff of each file against its fixed code
+
+and writes the results as json, for example:
+
+    $ python benchmarks/bench.py --vc git --files 50 -o results.json
+    $ python benchmarks/bench.py --vc git --files 50 --compare results.json
+
+"""
+
+from __future__ import print_function
+
+import json
+import os
+import platform
+import random
+import sys
+import time
+
+ROOT_DIR = os.path.split(os.path.abspath(os.path.dirname(__file__)))[0]
+sys.path.insert(0, ROOT_DIR)
+from pep8radius import Radius, fix_code, version
+from pep8radius.diff import get_diff
+from pep8radius.shell import CalledProcessError, from_dir, shell_out
+
+
+STAGES = ['init', 'get_filenames_diff', 'modified_lines', 'fix_code',
+          'get_diff']
+
+# Commands to init a repository and commit all its files.
+VCS = {
+    'git': (['git', 'init'], ['git', 'add', '.'],
+            ['git', 'commit', '-q', '-m']),
+    'hg': (['hg', 'init'], ['hg', 'add'], ['hg', 'commit', '-m']),
+    'bzr': (['bzr', 'init'], ['bzr', 'add'], ['bzr', 'commit', '-m']),
+}
+VCS['git-batch'] = VCS['git']
+
+BLOCK = '''def func_%(n)d(a, b):
+    """Docstring of func_%(n)d."""
+    total = a + b * %(n)d
+    if total > %(n)d:
+        return total - %(n)d
+    return total
+
+
+'''
+BLOCK_LINES = BLOCK.count('\n')
+
+
+def make_source(lines):
+    """Return clean python source code of (about) lines lines."""
+    return ''.join(BLOCK % {'n': n}
+                   for n in range(max(lines // BLOCK_LINES, 1)))
+
+
+def modify(source, hunks, rand, dirty=True):
+    """Change hunks of the blocks in source (spaced out evenly), if dirty
+    the changes need pep8 fixing."""
+    blocks = source.split('\n\n\n')[:-1]
+    step = max(len(blocks) // max(hunks, 1), 1)
+    for i in range(rand.randrange(step), len(blocks), step)[:hunks]:
+        n = rand.randrange(1000)
+        if dirty:
+            new = '    total=a+b*%d ;c = [1,2 ,3]\n' % n
+        else:
+            new = '    total = a + b * %d\n' % n
+        lines = blocks[i].split('\n')
+        lines[2] = new.rstrip('\n')
+        blocks[i] = '\n'.join(lines)
+    return '\n\n\n'.join(blocks) + '\n\n\n'
+
+
+def make_repo(vc, directory, files, lines, hunks, commits, seed=0):
+    """Create a repository in directory, with commits commits (of changes
+    to random files) and then uncommitted changes to every file."""
+    init, add, commit = VCS[vc]
+    rand = random.Random(seed)
+    os.makedirs(directory)
+    shell_out(init, cwd=directory)
+
+    names = [os.path.join('pkg%d' % (i // 100), 'mod%d.py' % i)
+             for i in range(files)]
+    sources = dict((name, make_source(lines)) for name in names)
+    for name, source in sources.items():
+        _write(directory, name, source)
+    shell_out(add, cwd=directory)
+    shell_out(commit + ['initial commit'], cwd=directory)
+
+    for c in range(commits):
+        for name in rand.sample(names, max(files // 10, 1)):
+            sources[name] = modify(sources[name], hunks, rand, dirty=False)
+            _write(directory, name, sources[name])
+        shell_out(add, cwd=directory)
+        shell_out(commit + ['commit %d' % c], cwd=directory)
+
+    for name in names:
+        _write(directory, name, modify(sources[name], hunks, rand))
+
+
+def _write(directory, name, source):
+    path = os.path.join(directory, name)
+    if not os.path.isdir(os.path.dirname(path)):
+        os.makedirs(os.path.dirname(path))
+    with open(path, 'w') as f:
+        f.write(source)
+
+
+def run_once(vc, directory, rev=None):
+    """Run each stage of pep8radius once, returning a dict of the time each
+    took."""
+    times = {}
+    with from_dir(directory):
+        t = time.time()
+        r = Radius(rev=rev, vc=vc, cwd=directory)
+        times['init'] = time.time() - t
+
+        t = time.time()
+        r.vc.get_filenames_diff(r)
+        times['get_filenames_diff'] = time.time() - t
+
+        t = time.time()
+        modified = [(f, r.modified_lines(f)) for f in r.filenames_diff]
+        times['modified_lines'] = time.time() - t
+
+        sources = []
+        for f, _ in modified:
+            with open(f) as source:
+                sources.append(source.read())
+
+        t = time.time()
+        fixed = [fix_code(source, lines, options=r.options)
+                 for source, (_, lines) in zip(sources, modified)]
+        times['fix_code'] = time.time() - t
+
+        t = time.time()
+        for source, fixed_source, (f, _) in zip(sources, fixed, modified):
+            get_diff(source, fixed_source, f)
+        times['get_diff'] = time.time() - t
+    return times
+
+
+def benchmark(vc, files, lines, hunks, commits, repeat=3, rev=None):
+    """Return the results of benchmarking pep8radius on a synthetic vc
+    repository (or None if vc isn't installed)."""
+    from shutil import rmtree
+    from tempfile import mkdtemp
+
+    temp = mkdtemp(prefix='pep8radius-bench-')
+    directory = os.path.join(temp, 'repo')
+    try:
+        try:
+            make_repo(vc, directory, files, lines, hunks, commits)
+        except (OSError, CalledProcessError):
+            return None
+        runs = [run_once(vc, directory, rev=rev) for _ in range(repeat)]
+    finally:
+        rmtree(temp, ignore_errors=True)
+
+    results = {}
+    for stage in STAGES:
+        times = sorted(run[stage] for run in runs)
+        results[stage] = {'min': times[0],
+                          'median': times[len(times) // 2],
+                          'mean': sum(times) / len(times)}
+    return {'vc': vc, 'files': files, 'lines': lines, 'hunks': hunks,
+            'commits': commits, 'repeat': repeat, 'stages': results}
+
+
+def compare(results, previous, threshold):
+    """Print the stages which are slower than in previous (by more than the
+    ratio threshold), returns whether there were any."""
+    def key(result):
+        return tuple(result[k] for k in ('vc', 'files', 'lines', 'hunks',
+                                         'commits'))
+    previous = dict((key(p), p) for p in previous['results'])
+    regressed = False
+    for result in results['results']:
+        before = previous.get(key(result))
+        if before is None:
+            continue
+        for stage in STAGES:
+            new = result['stages'][stage]['min']
+            old = before['stages'][stage]['min']
+            if old and new / old > threshold:
+                regressed = True
+                print("%s %s: %.4fs -> %.4fs (%.2fx slower)"
+                      % (result['vc'], stage, old, new, new / old),
+                      file=sys.stderr)
+    return regressed
+
+
+def create_parser():
+    from argparse import ArgumentParser
+    parser = ArgumentParser(description="Benchmark pep8radius on synthetic "
+                                        "repositories.")
+    parser.add_argument('--vc', default='git,hg,bzr',
+                        help="comma-separated version control systems "
+                             "(default: git,hg,bzr)")
+    parser.add_argument('--files', type=int, default=20,
+                        help="number of files (default: 20)")
+    parser.add_argument('--lines', type=int, default=500,
+                        help="lines per file (default: 500)")
+    parser.add_argument('--hunks', type=int, default=5,
+                        help="modified hunks per file (default: 5)")
+    parser.add_argument('--commits', type=int, default=10,
+                        help="commits of history (default: 10)")
+    parser.add_argument('--repeat', type=int, default=3,
+                        help="number of runs of each stage (default: 3)")
+    parser.add_argument('-o', '--output',
+                        help="write the results to this file (default: "
+                             "stdout)")
+    parser.add_argument('--compare', metavar='filename',
+                        help="exit 1 if slower than these previous results")
+    parser.add_argument('--threshold', type=float, default=1.2,
+                        help="slowdown ratio which is a regression "
+                             "(default: 1.2)")
+    return parser
+
+
+def main(args=None):
+    args = create_parser().parse_args(args)
+
+    results = []
+    for vc in args.vc.split(','):
+        result = benchmark(vc, args.files, args.lines, args.hunks,
+                           args.commits, repeat=args.repeat)
+        if result is None:
+            print("Skipping %s: not installed or not configured." % vc,
+                  file=sys.stderr)
+        else:
+            results.append(result)
+    results = {'pep8radius': version,
+               'python': platform.python_version(),
+               'platform': platform.platform(),
+               'results': results}
+
+    text = json.dumps(results, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare) as f:
+            previous = json.load(f)
+        return 1 if compare(results, previous, args.threshold) else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
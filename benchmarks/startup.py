@@ -0,0 +1,119 @@
+"""Benchmark the startup time of pep8radius, when there's nothing to fix.
+
+This times running pep8radius (in a new process) in a git repository without
+changes, and checks that none of the heavy modules (which are only needed
+to fix or print a diff) were imported. Exits 1 if the fastest run is over
+budget or a heavy module was imported:
+
+    $ python benchmarks/startup.py --budget 150
+
+"""
+
+from __future__ import print_function
+
+import json
+import os
+import subprocess
+import sys
+import time
+
+ROOT_DIR = os.path.split(os.path.abspath(os.path.dirname(__file__)))[0]
+
+HEAVY_MODULES = ['autopep8', 'colorama', 'difflib', 'docformatter',
+                 'multiprocessing', 'pep8', 'pycodestyle', 'yapf']
+
+SCRIPT = '''
+import sys
+sys.path.insert(0, %r)
+from pep8radius.main import main
+status = main(%r, apply_config=True)
+sys.stderr.write(repr(sorted(m for m in %r if m in sys.modules)))
+'''
+
+
+def run_once(args, cwd):
+    """Run pep8radius with args in cwd, returns the time taken and the heavy
+    modules it imported."""
+    script = SCRIPT % (ROOT_DIR, list(args), HEAVY_MODULES)
+    t = time.time()
+    p = subprocess.Popen([sys.executable, '-c', script], cwd=cwd,
+                         stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                         universal_newlines=True)
+    _, err = p.communicate()
+    elapsed = time.time() - t
+    return elapsed, eval(err.strip().splitlines()[-1])
+
+
+def make_repo(directory):
+    """Create a git repository (with a committed py file) in directory."""
+    os.makedirs(directory)
+    for cmd in (['git', 'init', '-q'], ['git', 'add', '.'],
+                ['git', 'commit', '-q', '-m', 'initial commit']):
+        if cmd[1] == 'add':
+            with open(os.path.join(directory, 'a.py'), 'w') as f:
+                f.write('a = 1\n')
+        subprocess.check_call(cmd, cwd=directory)
+
+
+def create_parser():
+    from argparse import ArgumentParser
+    parser = ArgumentParser(description="Benchmark the startup time of "
+                                        "pep8radius.")
+    parser.add_argument('--budget', type=float, default=150,
+                        help="maximum time (in ms) of the fastest run of "
+                             "pep8radius with nothing to fix (default: 150)")
+    parser.add_argument('--repeat', type=int, default=10,
+                        help="number of runs (default: 10)")
+    parser.add_argument('-o', '--output',
+                        help="write the results as json to this file")
+    return parser
+
+
+def main(args=None):
+    from shutil import rmtree
+    from tempfile import mkdtemp
+
+    args = create_parser().parse_args(args)
+    temp = mkdtemp(prefix='pep8radius-startup-')
+    try:
+        directory = os.path.join(temp, 'repo')
+        make_repo(directory)
+        results = {}
+        for name, argv in [('python', None), ('version', ['--version']),
+                           ('nothing_to_fix', [])]:
+            if argv is None:  # the time to start python itself
+                t = time.time()
+                subprocess.check_call([sys.executable, '-c', 'pass'])
+                runs = [(time.time() - t, [])]
+            else:
+                runs = [run_once(argv, directory)
+                        for _ in range(args.repeat)]
+            results[name] = {'min': min(r[0] for r in runs) * 1000,
+                             'imported': runs[0][1]}
+    finally:
+        rmtree(temp, ignore_errors=True)
+
+    text = json.dumps(results, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+
+    status = 0
+    for name in ['version', 'nothing_to_fix']:
+        if results[name]['imported']:
+            print("%s imported %s" % (name,
+                                      ', '.join(results[name]['imported'])),
+                  file=sys.stderr)
+            status = 1
+    if results['nothing_to_fix']['min'] > args.budget:
+        print("nothing_to_fix took %.1fms (budget %.1fms)"
+              % (results['nothing_to_fix']['min'], args.budget),
+              file=sys.stderr)
+        status = 1
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,6 +1,36 @@
 """PEP8 clean only the parts of the files touched since the last commit,
 a previous commit or (the merge-base of) a branch."""
 
-from pep8radius.main import parse_args, version, __version__
-from pep8radius.radius import Radius, fix_file, fix_code
-from pep8radius.shell import shell_out, shell_out_ignore_exitcode
+import sys
+
+# The public names, and the module each is defined in. These are imported on
+# first use, so that importing pep8radius (e.g. to run the cli) is quick.
+_EXPORTS = {'parse_args': 'pep8radius.main',
+            'version': 'pep8radius.main',
+            '__version__': 'pep8radius.main',
+            'Radius': 'pep8radius.radius',
+            'fix_file': 'pep8radius.radius',
+            'fix_code': 'pep8radius.radius',
+            'shell_out': 'pep8radius.shell',
+            'shell_out_ignore_exitcode': 'pep8radius.shell'}
+
+__all__ = sorted(_EXPORTS)
+
+if sys.version_info >= (3, 7):
+    def __getattr__(name):
+        try:
+            module = _EXPORTS[name]
+        except KeyError:
+            raise AttributeError("module 'pep8radius' has no attribute %r"
+                                 % name)
+        from importlib import import_module
+        value = getattr(import_module(module), name)
+        globals()[name] = value
+        return value
+
+    def __dir__():
+        return sorted(set(globals()) | set(_EXPORTS))
+else:  # pragma: no cover
+    from pep8radius.main import parse_args, version, __version__
+    from pep8radius.radius import Radius, fix_file, fix_code
+    from pep8radius.shell import shell_out, shell_out_ignore_exitcode
@@ -0,0 +1,130 @@
+"""This module defines the asyncio API of pep8radius (python 3.5+), for
+embedding pep8radius in an event loop without blocking it.
+
+The diffs of the modified files are got with asyncio subprocesses (several
+at once where possible). Creating the Radius (which finds the root, branch
+point and changed files) and the (CPU bound) fixing of each file are run in
+an executor (by default the loop's default executor).
+
+Example
+-------
+>>> async def review(cwd):
+...     r = await radius(rev='master', cwd=cwd)
+...     return [result.diff for result in await fix_async(r)]
+
+Note: this module isn't imported by pep8radius, as it isn't valid syntax on
+python 2.
+
+"""
+
+import asyncio
+from functools import partial
+from subprocess import PIPE, STDOUT
+
+from pep8radius.shell import CalledProcessError, _clean_output
+
+
+async def shell_out(cmd, stderr=STDOUT, cwd=None):
+    """Same as shell.shell_out, but running cmd as an asyncio
+    subprocess."""
+    process = await asyncio.create_subprocess_exec(*cmd, cwd=cwd,
+                                                   stdout=PIPE, stderr=stderr)
+    out, _ = await process.communicate()
+    out = out.decode('utf-8', 'replace').replace('\r\n', '\n')
+    if process.returncode:
+        raise CalledProcessError(process.returncode, cmd, output=out)
+    return _clean_output(out)
+
+
+async def shell_out_ignore_exitcode(cmd, stderr=STDOUT, cwd=None):
+    """Same as shell_out but doesn't raise if the cmd exits badly."""
+    try:
+        return await shell_out(cmd, stderr=stderr, cwd=cwd)
+    except CalledProcessError as c:
+        return _clean_output(c.output)
+
+
+async def get_modified_lines(r, file_names=None, executor=None):
+    """Same as r.vc.get_modified_lines(r, file_names), the diff of each
+    chunk of 256 file_names is got concurrently."""
+    from pep8radius.diff import iter_udiff
+    from pep8radius.vcs import GitBatch
+
+    vc = r.vc
+    if isinstance(vc, GitBatch):  # doesn't call out to git diff
+        return await _run(executor, vc.get_modified_lines, r, file_names)
+
+    if file_names is None:
+        cmds = [vc.diff_cmd(r)]
+    else:
+        cmds = [vc.diff_cmd(r) + ['--'] + file_names[i:i + 256]
+                for i in range(0, len(file_names), 256)]
+    lines = {}
+    for diff in await asyncio.gather(*[
+            shell_out_ignore_exitcode(cmd, cwd=vc.root) for cmd in cmds]):
+        lines.update(iter_udiff(diff.splitlines(), prefix=vc.diff_prefix,
+                                deleted=True))
+    return lines
+
+
+async def modified_lines(r, file_name, executor=None):
+    """Same as r.vc.modified_lines(r, file_name), the line ranges of a file
+    which have been changed (from its own diff)."""
+    from pep8radius.ranges import LineRanges
+    from pep8radius.vcs import GitBatch
+
+    vc = r.vc
+    if isinstance(vc, GitBatch):
+        return await _run(executor, vc.modified_lines, r, file_name)
+    diff = await shell_out_ignore_exitcode(vc.file_diff_cmd(r, file_name),
+                                           cwd=vc.root)
+    return LineRanges(vc.modified_lines_from_diff(diff))
+
+
+async def radius(rev=None, options=None, vc=None, cwd=None, executor=None):
+    """Create a Radius (see its arguments) in the executor, so the version
+    control commands it runs (to find the root, the branch point and the
+    changed files) don't block the loop."""
+    from pep8radius.radius import Radius
+    return await _run(executor, Radius, rev=rev, options=options, vc=vc,
+                      cwd=cwd)
+
+
+async def fix_async(r, executor=None):
+    """Fix each modified file of the Radius r, returns a list of the
+    FixResult of each (in the order of r.filenames_diff).
+
+    The modified lines of every file are found first (with asyncio
+    subprocesses), then the files are fixed concurrently in the executor.
+
+    Note: this doesn't print anything (unlike r.fix), or use r.state.
+
+    """
+    import os
+    from pep8radius.radius import _fix_file_star
+
+    if r._modified_lines is None:
+        r._modified_lines = await get_modified_lines(r, executor=executor)
+    if getattr(r, 'vc', None) is not None:
+        # The files missing from the diff (which r.modified_lines would
+        # diff one at a time, blocking the loop).
+        missing = [os.path.relpath(f, r.root) for f in r.filenames_diff]
+        missing = [f for f in missing if f not in r._modified_lines]
+        lines = await asyncio.gather(*[modified_lines(r, f, executor)
+                                       for f in missing])
+        r._modified_lines.update(zip(missing, lines))
+    args = r._fix_file_args(r.filenames_diff)
+    results = await asyncio.gather(*[_run(executor, _fix_file_star, a)
+                                     for a in args])
+    if r.cache is not None:
+        r.cache.prune()
+    r.close()
+    return [result for result, _, _ in results]
+
+
+def _run(executor, f, *args, **kwargs):
+    try:
+        loop = asyncio.get_running_loop()
+    except AttributeError:  # python < 3.7
+        loop = asyncio.get_event_loop()
+    return loop.run_in_executor(executor, partial(f, *args, **kwargs))
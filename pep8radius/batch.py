@@ -0,0 +1,181 @@
+"""This module defines the batch mode of pep8radius (--repo and --manifest),
+which fixes several repositories in one process.
+
+The Radius of each repository is created in a pool of threads (so their
+version control commands run at once), then the modified files of all the
+repositories are fixed in a single shared pool of processes. The output is
+the same as running pep8radius in each repository in turn, followed by one
+summary and exit status for them all.
+
+A manifest file lists a repository per line, optionally followed by the
+rev to compare against (otherwise the rev argument is used)::
+
+    # path [rev]
+    service-a
+    service-b origin/master
+
+Blank lines and lines starting with # are ignored, relative paths are
+relative to the manifest's directory.
+
+"""
+
+from __future__ import print_function
+
+import os
+
+
+def read_manifest(f, directory=''):
+    """Return a list of (root, rev) tuples of the repositories listed in the
+    manifest file object f, rev is None if it isn't given."""
+    repos = []
+    for line in f:
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        parts = line.split(None, 1)
+        rev = parts[1].strip() if len(parts) > 1 else None
+        repos.append((os.path.join(directory, parts[0]), rev))
+    return repos
+
+
+def batch_repos(args, cwd=None):
+    """Return a list of (root, rev) tuples of the repositories passed with
+    the --repo and --manifest options (relative to cwd)."""
+    cwd = cwd or os.getcwd()
+    repos = [(os.path.join(cwd, root), args.rev) for root in args.repo or []]
+    if args.manifest:
+        path = os.path.join(cwd, args.manifest)
+        try:
+            with open(path) as f:
+                repos.extend((root, rev or args.rev) for root, rev in
+                             read_manifest(f, os.path.dirname(path)))
+        except IOError as e:
+            raise NotImplementedError("Can't read the manifest %s: %s"
+                                      % (path, e.strerror))
+    return [(os.path.normpath(root), rev) for root, rev in repos]
+
+
+def radii(repos, options, arguments=None, apply_config=False, jobs=1):
+    """Create a Radius for each (root, rev) of repos, in a pool of jobs
+    threads, returning a list of (root, Radius or exception) tuples.
+
+    If apply_config (and the arguments list is passed), the options of each
+    repository are parsed from arguments with that repository's config.
+
+    """
+    from pep8radius.main import parse_args
+    from pep8radius.radius import Radius
+    from pep8radius.shell import CalledProcessError
+
+    def make(repo):
+        root, rev = repo
+        try:
+            opts = options
+            if apply_config and isinstance(arguments, list):
+                opts = parse_args(arguments, root=root, apply_config=True)
+            return root, Radius(rev=rev, options=opts, cwd=root)
+        except (CalledProcessError, NotImplementedError, OSError) as e:
+            return root, e
+
+    if jobs > 1 and len(repos) > 1:
+        from multiprocessing.pool import ThreadPool
+        pool = ThreadPool(min(jobs, len(repos)))
+        try:
+            return pool.map(make, repos)
+        finally:
+            pool.close()
+            pool.join()
+    return [make(repo) for repo in repos]
+
+
+def iter_fix_many(rs, jobs=1):
+    """Fix the modified files of each Radius in rs, yielding a tuple of
+    (Radius, FixResult) for each file (in the order of rs, then of their
+    filenames_diff).
+
+    If jobs is greater than 1 (less than 1 means one per CPU), the files of
+    every Radius are fixed in a single pool of that many processes.
+
+    """
+    from itertools import islice
+    from pep8radius.radius import _fix_file_star, _num_jobs
+
+    jobs = _num_jobs(jobs)
+    to_fix = [r._files_to_fix() for r in rs]
+
+    pool = None
+    if jobs > 1 and sum(len(files) for files, _ in to_fix) > 1:
+        from multiprocessing import Pool
+        args = [a for r, (files, _) in zip(rs, to_fix)
+                for a in r._fix_file_args(files)]
+        for r in rs:
+            r.close()
+        pool = Pool(min(jobs, len(args)))
+        results = pool.imap(_fix_file_star, args)
+
+    try:
+        for r, (files, skip) in zip(rs, to_fix):
+            if pool is None:
+                r_results = (r._fix_file_result(f) for f in files)
+            else:
+                # results is shared, the next len(files) are those of r.
+                r_results = r._count_hits(islice(results, len(files)))
+            for result in r._iter_results(r_results, skip):
+                yield r, result
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+
+def fix_many(repos, options, arguments=None, apply_config=False):
+    """Fix each of the repos (a list of (root, rev) tuples), printing the
+    diffs (depending on options) and a summary, returns the exit status.
+
+    The exit status is 1 if any repository failed (e.g. isn't a repository
+    or rev is unknown), or if there are any fixes with the error_status
+    option, otherwise 0.
+
+    """
+    from pep8radius.diff import print_diff
+    from pep8radius.radius import _maybe_print, _num_jobs, print_record
+
+    jobs = _num_jobs(options.jobs)
+    status = 0
+    rs = []
+    for root, r in radii(repos, options, arguments=arguments,
+                         apply_config=apply_config, jobs=jobs):
+        if isinstance(r, Exception):
+            output = getattr(r, 'output', None) or str(r) or repr(r)
+            output = output.splitlines()[0]
+            if options.format == 'jsonl':
+                import json
+                print(json.dumps({'repo': root, 'error': output},
+                                 sort_keys=True))
+            else:
+                print('%s: %s' % (root, output))
+            status = 1
+        else:
+            rs.append(r)
+
+    any_changes = False
+    total_lines_changed = total_files = 0
+    for r, result in iter_fix_many(rs, jobs=jobs):
+        total_files += 1
+        total_lines_changed += result.lines_changed
+        if result.diff:
+            any_changes = True
+        if r.format == 'jsonl':
+            print_record(result, diff=r.diff)
+        elif result.diff and r.diff:
+            print_diff(result.diff, color=r.color)
+
+    if options.format != 'jsonl':
+        _maybe_print('pep8radius %s %s lines in %s files in %s repositories.'
+                     % ('fixed' if options.in_place else 'would fix',
+                        total_lines_changed, total_files, len(rs)),
+                     verbose=options.verbose)
+
+    if any_changes and options.error_status:
+        status = 1
+    return status
@@ -0,0 +1,187 @@
+"""This module defines FixCache, a persistent (on-disk) cache of the results
+of fix_code, so re-fixing the same source code over the same line ranges
+(with the same options and versions of the tools) doesn't need to import or
+run autopep8 again.
+
+Each result is stored in its own file, named by the hash of the key. These
+are written atomically (so concurrent pep8radius runs can share a cache),
+and the least recently used are removed when the cache grows too large.
+
+"""
+
+import codecs
+import os
+
+
+DEFAULT_CACHE_DIR = '.pep8radius_cache'
+DEFAULT_CACHE_SIZE = 64  # MB
+
+# The options which don't change the output of fix_code.
+IGNORED_OPTIONS = set(['cache', 'cache_dir', 'cache_size', 'daemon', 'diff',
+                       'error_status', 'exclude', 'format', 'from_diff',
+                       'git_batch', 'global_config', 'ignore_local_config',
+                       'in_place', 'incremental', 'jobs', 'line_range',
+                       'list_fixes', 'manifest', 'no_color', 'profile',
+                       'profile_json', 'profile_stats', 'repo', 'rev',
+                       'socket', 'verbose', 'version', 'watch',
+                       'watch_interval'])
+
+_MODULE_VERSIONS = {}
+
+
+class FixCache(object):
+
+    """On-disk cache mapping the source code, line ranges, options and tool
+    versions passed to fix_code to the fixed code.
+
+    Keeps count of the hits and misses of get.
+
+    """
+
+    def __init__(self, directory, max_size=DEFAULT_CACHE_SIZE * 1024 ** 2):
+        self.directory = directory
+        self.max_size = max_size  # in bytes
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, source_code, line_ranges, options):
+        """Return the key (a hash) for the result of fix_code."""
+        import hashlib
+        line_ranges = [tuple(r) for r in line_ranges]
+        key = '\0'.join([fingerprint(options), repr(line_ranges),
+                         source_code])
+        return hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key)
+
+    def get(self, key):
+        """Return the fixed code stored for key, or None if there isn't
+        any."""
+        path = self._path(key)
+        try:
+            with codecs.open(path, 'r', encoding='utf-8') as f:
+                fixed = f.read()
+        except IOError:
+            self.misses += 1
+            return None
+
+        try:
+            # Update the modification time, this is used for LRU eviction.
+            os.utime(path, None)
+        except OSError:  # pragma: no cover
+            pass  # e.g. removed by another process
+        self.hits += 1
+        return fixed
+
+    def set(self, key, fixed):
+        """Store fixed as the result for key."""
+        from tempfile import mkstemp
+        make_cache_directory(self.directory)
+        fd, temp = mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(fixed.encode('utf-8'))
+        _replace(temp, self._path(key))
+
+    def prune(self):
+        """Remove the least recently used results until the cache is smaller
+        than max_size."""
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return
+
+        entries = []
+        for name in names:
+            if name.startswith('.') or name.endswith('.tmp'):
+                continue
+            try:
+                st = os.stat(self._path(name))
+            except OSError:  # pragma: no cover
+                continue  # removed by another process
+            entries.append((st.st_mtime, st.st_size, name))
+
+        size = sum(e[1] for e in entries)
+        for _, entry_size, name in sorted(entries):
+            if size <= self.max_size:
+                break
+            try:
+                os.remove(self._path(name))
+            except OSError:  # pragma: no cover
+                pass
+            size -= entry_size
+
+
+def make_cache_directory(directory):
+    """Create directory (if it doesn't exist), hidden from git."""
+    if os.path.isdir(directory):
+        return
+    try:
+        os.makedirs(directory)
+        # Don't let git see the cache.
+        with open(os.path.join(directory, '.gitignore'), 'w') as f:
+            f.write('*\n')
+    except OSError:  # pragma: no cover
+        pass  # created by another process
+
+
+def fingerprint(options):
+    """Return a string identifying the options (those which change the
+    output of fix_code) and the versions of pep8radius and the tools it
+    uses."""
+    from pep8radius.main import __version__
+
+    opts = sorted((k, sorted(v) if isinstance(v, (set, list, tuple)) else v)
+                  for k, v in vars(options).items()
+                  if k not in IGNORED_OPTIONS)
+    tools = ['autopep8', 'pep8', 'pycodestyle']
+    if getattr(options, 'docformatter', False):
+        tools.append('docformatter')
+    if getattr(options, 'yapf', False):
+        tools.append('yapf')
+    versions = [(t, module_version(t)) for t in tools]
+    return '\0'.join([__version__, repr(opts), repr(versions)])
+
+
+def module_version(name):
+    """Identify the installed version of the module name, without importing
+    it, by the path, size and modification time of its source file."""
+    try:
+        return _MODULE_VERSIONS[name]
+    except KeyError:
+        pass
+
+    try:
+        from importlib.util import find_spec
+        try:
+            spec = find_spec(name)
+        except (ImportError, ValueError):  # pragma: no cover
+            spec = None
+        path = spec and spec.origin
+    except ImportError:  # py2, pragma: no cover
+        import imp
+        try:
+            path = imp.find_module(name)[1]
+        except ImportError:
+            path = None
+
+    try:
+        st = os.stat(path)
+        version = (path, st.st_size, st.st_mtime)
+    except (OSError, TypeError):
+        version = None
+    _MODULE_VERSIONS[name] = version
+    return version
+
+
+def _replace(src, dst):
+    """Atomically move the file src to dst (overwriting dst)."""
+    try:
+        replace = os.replace
+    except AttributeError:  # py2, pragma: no cover
+        replace = os.rename
+    try:
+        replace(src, dst)
+    except OSError:  # pragma: no cover
+        # e.g. on Windows (py2) if another process has written dst
+        os.remove(src)
@@ -0,0 +1,274 @@
+"""This module defines the pep8radius daemon (started with pep8radius
+--daemon), and a thin client (the pep8radius-client command).
+
+The daemon keeps the modules pep8radius uses (autopep8, docformatter etc.)
+imported, and the memoized lookups warm: which version control and root
+directory each working directory has, and the parsed config files (reread
+when they're modified). The branch point isn't cached, as it changes with
+each commit.
+
+The client forwards its arguments and working directory over a unix socket
+and writes out the output and exit status exactly as main would have done.
+
+Messages are lines of json: the request {"argv": ..., "cwd": ...,
+"isatty": ...}, and the responses {"stdout": text}, {"stderr": text} and
+finally {"status": exit_status}.
+
+Note: if the daemon isn't running the client runs pep8radius itself.
+
+"""
+
+from __future__ import print_function
+
+import json
+import os
+import socket
+import sys
+
+
+def default_socket():
+    """Return the path of the socket, from the PEP8RADIUS_SOCKET environment
+    variable or otherwise a file in the user's private runtime directory
+    ($XDG_RUNTIME_DIR, or a per user 0700 directory in the temp
+    directory)."""
+    path = os.environ.get('PEP8RADIUS_SOCKET')
+    if path:
+        return path
+    runtime = os.environ.get('XDG_RUNTIME_DIR')
+    if runtime:
+        return os.path.join(runtime, 'pep8radius.sock')
+    from tempfile import gettempdir
+    user = getattr(os, 'getuid', lambda: 'user')()
+    directory = os.path.join(gettempdir(), 'pep8radius-%s' % user)
+    try:
+        os.mkdir(directory, 0o700)
+    except OSError:
+        pass  # it exists, _is_private checks it's ours
+    return os.path.join(directory, 'daemon.sock')
+
+
+def _is_private(socket_path):
+    """Whether the socket's directory (and the socket, if it exists) belong
+    to this user, and other users can't write to the directory (so they
+    can't have put their own socket there)."""
+    if not hasattr(os, 'getuid'):  # pragma: no cover
+        return True
+    try:
+        directory = os.stat(os.path.dirname(os.path.abspath(socket_path)))
+        owners = [directory.st_uid]
+        if os.path.lexists(socket_path):
+            owners.append(os.lstat(socket_path).st_uid)
+    except OSError:
+        return False
+    return (all(uid == os.getuid() for uid in owners) and
+            not directory.st_mode & 0o022)
+
+
+def _send(conn, **message):
+    conn.sendall((json.dumps(message) + '\n').encode('utf-8'))
+
+
+class _SocketWriter(object):
+
+    """File-like object which sends everything written to it to the client,
+    as the stream (e.g. 'stdout') of the client."""
+
+    closed = False
+
+    def __init__(self, conn, stream, isatty=False):
+        self.conn = conn
+        self.stream = stream
+        self._isatty = isatty
+
+    def write(self, text):
+        if text:
+            _send(self.conn, **{self.stream: text})
+
+    def flush(self):
+        pass
+
+    def isatty(self):
+        return self._isatty
+
+
+def warm_up():
+    """Import the modules which pep8radius may need."""
+    import colorama
+    import difflib
+    import autopep8
+    from pep8radius import cache, fixer, main, radius, vcs
+    try:
+        import docformatter
+    except ImportError:  # pragma: no cover
+        pass
+
+
+def serve(socket_path=None):  # pragma: no cover
+    """Run the daemon, answering requests on socket_path until interrupted.
+
+    Requests are handled one at a time.
+
+    """
+    if not hasattr(socket, 'AF_UNIX'):
+        raise NotImplementedError("The daemon requires unix sockets.")
+    if socket_path is None:
+        socket_path = default_socket()
+    if not _is_private(socket_path):
+        raise NotImplementedError("%s is in a directory other users can "
+                                  "write to (or don't own)." % socket_path)
+    if run_in_daemon(['--version'], stdout=_Null(),
+                     socket_path=socket_path) is not None:
+        raise NotImplementedError("A daemon is already listening on %s."
+                                  % socket_path)
+    if os.path.exists(socket_path):
+        os.remove(socket_path)  # left behind by a daemon which was killed
+
+    import signal
+    # Clean up (remove the socket) if killed.
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
+    warm_up()
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        server.bind(socket_path)
+        server.listen(5)
+        while True:
+            conn, _ = server.accept()
+            try:
+                handle(conn)
+            except socket.error:
+                pass  # the client has gone away
+            finally:
+                conn.close()
+    except KeyboardInterrupt:
+        return 0
+    finally:
+        server.close()
+        os.remove(socket_path)
+
+
+def handle(conn):
+    """Answer a single request on conn, by running main with the request's
+    arguments from the request's directory."""
+    from pep8radius.main import main
+
+    request = json.loads(conn.makefile('rb').readline().decode('utf-8'))
+    if _in_process(request['argv']):
+        # e.g. --watch runs until interrupted, blocking every other client.
+        _send(conn, stderr="pep8radius: the daemon can't run %s, run "
+              "pep8radius itself.\n" % ' '.join(request['argv']))
+        _send(conn, status=2)
+        return
+    isatty = request.get('isatty', False)
+    old_stdout, old_stderr = sys.stdout, sys.stderr
+    sys.stdout = _SocketWriter(conn, 'stdout', isatty=isatty)
+    sys.stderr = _SocketWriter(conn, 'stderr', isatty=isatty)
+    try:
+        status = main(request['argv'], cwd=request['cwd'],
+                      apply_config=True)
+    except SystemExit as e:  # e.g. from argparse
+        status = e.code
+    except Exception:
+        import traceback
+        traceback.print_exc()
+        status = 1
+    finally:
+        sys.stdout, sys.stderr = old_stdout, old_stderr
+    _send(conn, status=status or 0)
+
+
+class _Null(object):
+
+    def write(self, text):
+        pass
+
+    def flush(self):
+        pass
+
+
+def run_in_daemon(args, cwd=None, stdout=None, stderr=None,
+                  socket_path=None):
+    """Run pep8radius with args in the daemon, writing its output to stdout
+    and stderr.
+
+    Returns the exit status, or None if the daemon isn't running.
+
+    """
+    if not hasattr(socket, 'AF_UNIX'):  # pragma: no cover
+        return None
+    stdout = sys.stdout if stdout is None else stdout
+    stderr = sys.stderr if stderr is None else stderr
+    if socket_path is None:
+        socket_path = default_socket()
+    if cwd is None:
+        cwd = os.getcwd()
+    if not _is_private(socket_path):
+        return None  # it could be another user's daemon, don't trust it
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        try:
+            sock.connect(socket_path)
+        except socket.error:
+            return None
+        isatty = getattr(stdout, 'isatty', lambda: False)()
+        _send(sock, argv=list(args), cwd=cwd, isatty=isatty)
+
+        for line in sock.makefile('rb'):
+            message = json.loads(line.decode('utf-8'))
+            if 'status' in message:
+                return message['status']
+            if 'stdout' in message:
+                stdout.write(message['stdout'])
+                stdout.flush()
+            if 'stderr' in message:
+                stderr.write(message['stderr'])
+                stderr.flush()
+    finally:
+        sock.close()
+
+    print("pep8radius daemon exited unexpectedly.", file=stderr)
+    return 1
+
+
+def _in_process(args):
+    """Whether args has to be run in the client's process, as it reads stdin
+    (--from-diff) or runs until interrupted (--daemon and --watch).
+
+    The args are parsed as main would (so e.g. --dae is --daemon), if they
+    can't be parsed main can report that wherever it's run.
+
+    """
+    from pep8radius.main import create_parser
+    parser = create_parser()
+
+    def fail(*args, **kwargs):
+        raise ValueError()
+    # Don't print help (or errors) or exit, main will do that.
+    parser.print_help = parser.error = parser.exit = fail
+    try:
+        parsed = parser.parse_args(args)
+    except ValueError:
+        return False
+    if parsed.from_diff not in (None, sys.stdin):
+        parsed.from_diff.close()
+    return bool(parsed.from_diff or parsed.daemon or parsed.watch)
+
+
+def client(args, cwd=None):
+    """Run pep8radius with args in the daemon, or in this process if the
+    daemon isn't running (or args requires reading stdin, or runs until
+    interrupted)."""
+    status = None if _in_process(args) else run_in_daemon(args, cwd=cwd)
+    if status is None:
+        from pep8radius.main import main
+        status = main(args, cwd=cwd, apply_config=True)
+    return status
+
+
+def client_main(args=None):  # pragma: no cover
+    if args is None:
+        args = sys.argv[1:]
+    from pep8radius.shell import exit_on_broken_pipe
+    exit_on_broken_pipe()
+    return sys.exit(client(args))
@@ -5,23 +5,151 @@ from __future__ import print_function
 
 import os
 import re
+from sys import version_info
+
+
+if version_info[0] > 2:  # py3, pragma: no cover
+    basestring = str
 
 
 def modified_lines_from_udiff(udiff):
     """Extract from a udiff an iterator of tuples of (start, end) line
     numbers."""
-    chunks = re.split('\n@@ [^\n]+\n', udiff)[1:]
+    for _, line_ranges in iter_udiff(udiff.splitlines()):
+        for start, end in line_ranges:
+            yield start, end
+
+
+_HUNK_RE = re.compile(r'@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@')
+
+
+def iter_udiff(lines, prefix=None, deleted=False):
+    """Parse a udiff in a single pass over lines (e.g. a file object),
+    yielding a tuple of (file_name, LineRanges) for each file in it.
+
+    The line range of each hunk is from its first to its last added line.
+    The file_name is taken from the +++ line (with any timestamp and
+    prefix, e.g. 'b/', removed). If prefix is None the prefix is guessed,
+    it's the first directory of the new file name if that differs from the
+    old file name's (e.g. 'a/' and 'b/' in git and hg diffs). Binary files,
+    and renames without changes, are not included. Deleted files are only
+    included if deleted, with no line ranges (their file_name is taken from
+    the --- line). Hunks before any file header are yielded with a
+    file_name of None.
+
+    Only the current file's line ranges are kept, so this uses bounded
+    memory however large the diff.
+
+    """
+    old_name, file_name = '', None
+    ranges, skip = [], False
+    old_left = new_left = 0  # lines of the current hunk yet to be read
+    for line in lines:
+        line = line.rstrip('\r\n')
+
+        if old_left > 0 or new_left > 0:
+            c = line[:1]
+            if c == '+':
+                ranges[-1][0] = ranges[-1][0] or new_line
+                ranges[-1][1] = new_line
+                new_line += 1
+                new_left -= 1
+                continue
+            elif c == '-':
+                old_left -= 1
+                continue
+            elif c in (' ', ''):  # (trailing whitespace may be stripped)
+                new_line += 1
+                old_left -= 1
+                new_left -= 1
+                continue
+            elif c == '\\':  # No newline at end of file
+                continue
+            old_left = new_left = 0  # the hunk is truncated
+
+        if line.startswith('@@ '):
+            match = _HUNK_RE.match(line)
+            if match is not None:
+                old_left = int(match.group(2) or 1)
+                new_line = int(match.group(3))
+                new_left = int(match.group(4) or 1)
+                ranges.append([0, 0])
+        elif line.startswith('--- ') or line.startswith('diff '):
+            if file_name is not None or ranges:
+                if not skip:
+                    yield file_name, _line_ranges(ranges)
+                file_name, ranges = None, []
+            skip = line.startswith('diff ')  # until we see +++
+            if line.startswith('--- '):
+                old_name = _udiff_file_name(line)
+        elif line.startswith('+++ '):
+            new_name = _udiff_file_name(line)
+            skip = False
+            strip = prefix
+            if new_name == '/dev/null':
+                skip = not deleted
+                new_name = old_name
+                if prefix:
+                    strip = 'a/' if prefix == 'b/' else prefix
+                elif prefix is None:
+                    strip = 'a/' if old_name.startswith('a/') else ''
+            elif prefix is None:
+                strip = _udiff_prefix(old_name, new_name)
+            if new_name.startswith(strip):
+                new_name = new_name[len(strip):]
+            file_name = os.path.normpath(new_name)
+        elif (line.startswith('Binary files ') or
+              line.startswith('GIT binary patch')):
+            skip = True
+
+    if (file_name is not None or ranges) and not skip:
+        yield file_name, _line_ranges(ranges)
+
 
-    line_numbers = re.findall('@@\s[+-]\d+,\d+ \+(\d+)', udiff)
-    line_numbers = list(map(int, line_numbers))
+def _udiff_prefix(old_name, new_name):
+    """Guess the prefix of new_name, e.g. 'b/' when old_name is 'a/...'."""
+    new_prefix = new_name.split('/', 1)[0] + '/'
+    if old_name == '/dev/null':
+        return 'b/' if new_prefix == 'b/' else ''
+    old_prefix = old_name.split('/', 1)[0] + '/'
+    if '/' in old_name and '/' in new_name and old_prefix != new_prefix:
+        return new_prefix
+    return ''
 
-    for c, start in zip(chunks, line_numbers):
-        ilines = enumerate((line for line in c.splitlines()
-                            if not line.startswith('-')),
-                           start=start)
-        added_lines = [i for i, line in ilines if line.startswith('+')]
-        if added_lines:
-            yield (added_lines[0], added_lines[-1])
+
+def _udiff_file_name(line):
+    """The file name from a ---/+++ line (without any timestamp)."""
+    name = line[4:].split('\t')[0].rstrip()
+    if len(name) > 1 and name[0] == name[-1] == '"':  # e.g. has spaces
+        name = name[1:-1]
+    return name
+
+
+def _line_ranges(ranges):
+    from pep8radius.ranges import LineRanges
+    return LineRanges(tuple(r) for r in ranges if r[0])
+
+
+def modified_lines_from_sources(original, modified, n=3):
+    """Return the LineRanges of (start, end) line numbers of modified which
+    have been changed from original, without calling version control.
+
+    These are the same as modified_lines_from_udiff would find in the udiff
+    (with n lines of context), except that difflib may match up lines
+    differently to the version control's diff.
+
+    """
+    from difflib import SequenceMatcher
+    from pep8radius.ranges import LineRanges
+    matcher = SequenceMatcher(None, original.splitlines(True),
+                              modified.splitlines(True))
+    lines = []
+    for group in matcher.get_grouped_opcodes(n):
+        added = [(j1 + 1, j2) for tag, _, _, j1, j2 in group
+                 if tag in ('replace', 'insert')]
+        if added:
+            lines.append((added[0][0], added[-1][1]))
+    return LineRanges(lines)
 
 
 def udiff_lines_fixed(u):
@@ -31,59 +159,237 @@ def udiff_lines_fixed(u):
     return len(removed_changes)
 
 
+def udiff_stats(udiff):
+    """Return a tuple of the number of lines added and removed in udiff,
+    and the LineRanges of the original's lines which were changed.
+
+    A hunk's changed lines are from its first to its last removed line, or
+    if it only adds lines the line they're added after.
+
+    """
+    from pep8radius.ranges import LineRanges
+    added = removed = 0
+    ranges = []
+    old_line = 0
+    for line in udiff.splitlines():
+        c = line[:1]
+        if c == '+' and not line.startswith('+++ '):
+            added += 1
+            at = max(old_line - 1, 1)
+            if not ranges or ranges[-1][1] < at:
+                ranges.append([at, at])
+        elif c == '-' and not line.startswith('--- '):
+            removed += 1
+            if ranges and ranges[-1][1] >= old_line - 1:
+                ranges[-1][1] = old_line
+            else:
+                ranges.append([old_line, old_line])
+            old_line += 1
+        elif c == ' ':
+            old_line += 1
+        elif c == '@':
+            match = _HUNK_RE.match(line)
+            if match is not None:
+                old_line = int(match.group(1)) or 1
+                if match.group(2) == '0':  # the lines are added after this
+                    old_line += 1
+    return added, removed, LineRanges(tuple(r) for r in ranges)
+
+
 def get_diff(original, fixed, file_name,
              original_label='original', fixed_label='fixed'):
     """Return text of unified diff between original and fixed."""
+    if original == fixed:
+        return ''
     original, fixed = original.splitlines(True), fixed.splitlines(True)
     newline = '\n'
 
-    from difflib import unified_diff
-    diff = unified_diff(original, fixed,
-                        os.path.join(original_label, file_name),
-                        os.path.join(fixed_label, file_name),
-                        lineterm=newline)
-    text = ''
-    for line in diff:
-        text += line
+    text = []
+    for line in _unified_diff(original, fixed,
+                              os.path.join(original_label, file_name),
+                              os.path.join(fixed_label, file_name),
+                              lineterm=newline):
+        text.append(line)
         # Work around missing newline (http://bugs.python.org/issue2142).
         if not line.endswith(newline):
-            text += newline + r'\ No newline at end of file' + newline
-    return text
+            text.append(newline + r'\ No newline at end of file' + newline)
+    return ''.join(text)
 
 
-def print_diff(diff, color=True):
+def _unified_diff(a, b, fromfile, tofile, n=3, lineterm='\n'):
+    """Same as difflib's unified_diff, but without running the matcher over
+    (most of) the lines at the start and end which are the same in a and b.
+
+    difflib's matcher picks the longest matching block first, for the
+    common prefix (or suffix) the strength of this is the longest run of
+    lines (which are not "popular") within it. So we keep the earliest of
+    these runs, and give the matcher the same popular lines as it would
+    have for all of b, so that it makes the same choices.
+
+    """
+    from difflib import SequenceMatcher
+
+    shortest = min(len(a), len(b))
+    prefix = 0
+    while prefix < shortest and a[prefix] == b[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < shortest - prefix and a[-1 - suffix] == b[-1 - suffix]:
+        suffix += 1
+
+    popular = _popular(b)
+    start = _longest_run(a, 0, prefix, popular, n)
+    start = 0 if start is None else max(min(prefix - n, start), 0)
+    end = _longest_run(a, len(a) - suffix, len(a), popular, n, end=True)
+    stop = 0 if end is None else max(min(suffix - n, len(a) - end), 0)
+
+    try:
+        matcher = SequenceMatcher(None, a[start:len(a) - stop],
+                                  b[start:len(b) - stop], autojunk=False)
+    except TypeError:  # py2.6, pragma: no cover
+        start = stop = 0
+        matcher = SequenceMatcher(None, a, b)
+    for line in popular:
+        matcher.b2j.pop(line, None)
+
+    started = False
+    for group in matcher.get_grouped_opcodes(n):
+        if not started:
+            started = True
+            yield '--- %s%s' % (fromfile, lineterm)
+            yield '+++ %s%s' % (tofile, lineterm)
+
+        first, last = group[0], group[-1]
+        file1_range = _format_range_unified(start + first[1], start + last[2])
+        file2_range = _format_range_unified(start + first[3], start + last[4])
+        yield '@@ -%s +%s @@%s' % (file1_range, file2_range, lineterm)
+
+        for tag, i1, i2, j1, j2 in group:
+            if tag == 'equal':
+                for line in matcher.a[i1:i2]:
+                    yield ' ' + line
+                continue
+            if tag in ('replace', 'delete'):
+                for line in matcher.a[i1:i2]:
+                    yield '-' + line
+            if tag in ('replace', 'insert'):
+                for line in matcher.b[j1:j2]:
+                    yield '+' + line
+
+
+def _longest_run(a, lo, hi, popular, n, end=False):
+    """Return the start (or if end the end) of the earliest longest run of
+    lines in a[lo:hi] which are not popular, or None if it's not longer than
+    n (then the matcher's choices are too easily swayed to trim safely)."""
+    best, best_start, run_start = 0, lo, lo
+    for i in range(lo, hi):
+        if a[i] in popular:
+            run_start = i + 1
+        elif i + 1 - run_start > best:
+            best, best_start = i + 1 - run_start, run_start
+    if best <= n:
+        return None
+    return best_start + best if end else best_start
+
+
+def _popular(b):
+    """The lines which difflib's autojunk heuristic would ignore in b."""
+    if len(b) < 200:
+        return set()
+    counts = {}
+    for line in b:
+        counts[line] = counts.get(line, 0) + 1
+    ntest = len(b) // 100 + 1
+    return set(line for line, count in counts.items() if count > ntest)
+
+
+def _format_range_unified(start, stop):
+    """Convert range to the "ed" format (as in difflib)."""
+    beginning = start + 1  # lines start numbering with one
+    length = stop - start
+    if length == 1:
+        return '%s' % beginning
+    if not length:
+        beginning -= 1  # empty ranges begin at line just before the range
+    return '%s,%s' % (beginning, length)
+
+
+def print_diff(diff, color=True, file=None):
     """Pretty printing for a diff, if color then we use a simple color scheme
-    (red for removed lines, green for added lines)."""
-    import colorama
+    (red for removed lines, green for added lines).
+
+    diff is the text of the diff, or an iterable of its lines. It's written
+    to file (default sys.stdout) in large chunks, without splitting all of
+    it into lines first. Color is only used if file is a terminal (as
+    colorama would strip it otherwise).
+
+    """
+    import sys
 
     if not diff:
         return
+    if file is None:
+        file = sys.stdout
+    if color:
+        file, color = _color_stream(file)
+
+    if isinstance(diff, basestring):
+        if not color:  # then there's nothing to add to the lines
+            file.write(diff if diff.endswith('\n') else diff + '\n')
+            file.flush()
+            return
+        diff = _iter_lines(diff)
 
-    if not color:
-        colorama.init = lambda autoreset: None
-        colorama.Fore.RED = ''
-        colorama.Back.RED = ''
-        colorama.Fore.GREEN = ''
-        colorama.deinit = lambda: None
+    if color:
+        from colorama import Back, Fore, Style
+        added, removed, reset = Fore.GREEN, Fore.RED, Style.RESET_ALL
+        trailing_ws = Back.RED
+    else:
+        added = removed = reset = trailing_ws = ''
 
-    colorama.init(autoreset=True)  # TODO use context_manager
-    for line in diff.splitlines():
-        if line.startswith('+') and not line.startswith('+++ '):
+    chunk = []
+    for line in diff:
+        line = line.rstrip('\r\n')
+        c = line[:1]
+        if c == '+' and not line.startswith('+++ '):
             # Note there shouldn't be trailing whitespace
             # but may be nice to generalise this
-            print(colorama.Fore.GREEN + line)
-        elif line.startswith('-') and not line.startswith('--- '):
-            split_whitespace = re.split('(\s+)$', line)
-            if len(split_whitespace) > 1:  # claim it must be 3
-                line, trailing, _ = split_whitespace
-            else:
-                line, trailing = split_whitespace[0], ''
-            print(colorama.Fore.RED + line, end='')
+            chunk.append(added + line + reset + '\n')
+        elif c == '-' and not line.startswith('--- '):
             # give trailing whitespace a RED background
-            print(colorama.Back.RED + trailing)
-        elif line == '\ No newline at end of file':
+            stripped = line.rstrip()
+            chunk.append(removed + stripped + reset)
+            if len(stripped) < len(line):
+                chunk.append(trailing_ws + line[len(stripped):] + reset)
+            chunk.append('\n')
+        elif line == '\\ No newline at end of file':
             # The assumption here is that there is now a new line...
-            print(colorama.Fore.RED + line)
+            chunk.append(removed + line + reset + '\n')
         else:
-            print(line)
-    colorama.deinit()
+            chunk.append(line + '\n')
+        if len(chunk) >= 4096:
+            file.write(''.join(chunk))
+            chunk = []
+    file.write(''.join(chunk))
+    file.flush()
+
+
+def _color_stream(file):
+    """Return a tuple of the stream to write colored output for file to,
+    and whether to use color at all (not if file isn't a terminal)."""
+    from colorama import AnsiToWin32
+    wrapper = AnsiToWin32(file)
+    if wrapper.convert:  # an old windows console, pragma: no cover
+        return wrapper.stream, True
+    return file, not wrapper.strip
+
+
+def _iter_lines(text):
+    """Yield each line of text (without its newline)."""
+    start, n = 0, len(text)
+    while start < n:
+        end = text.find('\n', start)
+        if end == -1:
+            end = n
+        yield text[start:end]
+        start = end + 1
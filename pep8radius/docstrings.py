@@ -0,0 +1,75 @@
+"""This module finds the docstrings in python source code (with a single
+tokenize pass), so that docformatter is only run where there are docstrings
+to format, and at most once per file."""
+
+from pep8radius.ranges import LineRanges
+
+
+def docstring_index(source_code, until=None):
+    """Return a list of the docstrings in source_code, as tuples of
+    (start, end, indentation, docstring) where start and end are the
+    (row, col) positions of the string token.
+
+    These are the strings docformatter formats: the first statement of the
+    module or of an indented block (a class, function, ...). Returns None
+    if source_code can't be tokenized. If until is passed, tokenizing stops
+    at the first token starting after that line.
+
+    """
+    import io
+    import tokenize
+
+    docstrings = []
+    previous_string, previous_type = '', None
+    only_comments_so_far = True
+    try:
+        for token_type, string, start, end, _ in tokenize.generate_tokens(
+                io.StringIO(source_code).readline):
+            if until is not None and start[0] > until:
+                break
+            if (token_type == tokenize.STRING and
+                    string.startswith(('"', "'")) and
+                    (previous_type == tokenize.INDENT or
+                     only_comments_so_far)):
+                indentation = '' if only_comments_so_far else previous_string
+                docstrings.append((start, end, indentation, string))
+            if token_type not in (tokenize.COMMENT, tokenize.NEWLINE,
+                                  tokenize.NL):
+                only_comments_so_far = False
+            previous_string, previous_type = string, token_type
+    except (tokenize.TokenError, IndentationError):
+        return None
+    return docstrings
+
+
+def format_docstrings(source_code, line_ranges, **kwargs):
+    """Apply docformatter's format_docstring (with kwargs) to the docstrings
+    of source_code which are on one of the line_ranges.
+
+    This is the same as calling docformatter's format_code once for each
+    line range, but only tokenizes the source (up to the last line range)
+    once, and docformatter isn't imported if there are no docstrings on the
+    line_ranges.
+
+    """
+    line_ranges = LineRanges(line_ranges)
+    if not line_ranges:
+        return source_code
+    # Only the source up to the last line range needs to be tokenized.
+    index = docstring_index(source_code, until=line_ranges[-1][1])
+    if not index:
+        return source_code
+    index = [d for d in index if line_ranges.intersects(d[0][0], d[1][0])]
+    if not index:
+        return source_code
+
+    import io
+    from docformatter import format_docstring
+    # The same lines as tokenize's rows (only split on '\n').
+    lines = io.StringIO(source_code).readlines()
+    # Replace from the end, so that the earlier positions are still valid.
+    for (srow, scol), (erow, ecol), indentation, docstring in reversed(index):
+        formatted = format_docstring(indentation, docstring, **kwargs)
+        lines[srow - 1:erow] = [lines[srow - 1][:scol] + formatted +
+                                lines[erow - 1][ecol:]]
+    return ''.join(lines)
@@ -0,0 +1,211 @@
+"""This module applies autopep8 over several line ranges of some source code
+at once, rather than running autopep8 over the entire file once per line
+range.
+
+Note: This subclasses autopep8's FixPEP8 (filtering the pep8 results to
+those in the line ranges), so relies on some autopep8 internals. If these
+aren't available importing this module raises an ImportError and
+pep8radius falls back to fixing one line range at a time.
+
+"""
+
+from __future__ import print_function
+
+from bisect import bisect_right
+from copy import copy
+import io
+import sys
+
+from autopep8 import (FixPEP8, _execute_pep8, filter_results, find_newline,
+                      normalize_line_endings)
+
+from pep8radius.ranges import LineRanges
+
+# The options autopep8's FixPEP8 passes to pep8 (the later ones by newer
+# versions of autopep8), each is passed if options has it.
+PEP8_OPTIONS = ('ignore', 'select', 'max_line_length', 'max_doc_length',
+                'hang_closing', 'indent_size')
+
+
+class FixPEP8LineRanges(FixPEP8):
+
+    """Fix only the pep8 results which are on one of the line_ranges.
+
+    After fix is called line_ranges is updated to the line numbers of the
+    corresponding lines in the fixed source.
+
+    """
+
+    def __init__(self, line_ranges, *args, **kwargs):
+        self.line_ranges = line_ranges
+        super(FixPEP8LineRanges, self).__init__(*args, **kwargs)
+
+    def _fix_source(self, results):
+        results = [r for r in results if r['line'] in self.line_ranges]
+        return super(FixPEP8LineRanges, self)._fix_source(results)
+
+    def fix(self, results=None):
+        """Return the fixed source. If results (of the pep8 check of the
+        source, see check_line_ranges) are passed, these are fixed rather
+        than checking the source again."""
+        if results is None:
+            fixed = super(FixPEP8LineRanges, self).fix()
+        else:
+            self._fix_source(results)
+            fixed = ''.join(self.source)
+        # Each item of self.source is one line of the original source, but
+        # may now contain zero or several lines.
+        self.line_ranges = LineRanges(self._fixed_line_range(start, end)
+                                      for start, end in self.line_ranges)
+        return fixed
+
+    def _fixed_line_range(self, start, end):
+        start_ = ''.join(self.source[:start - 1]).count('\n') + 1
+        count = len(io.StringIO(''.join(self.source[start - 1:end]))
+                    .readlines())
+        return start_, start_ + max(count, 1) - 1
+
+
+def fix_line_ranges(source_code, line_ranges, options):
+    """Apply autopep8 to source_code over all the line_ranges in one go.
+
+    Returns a tuple of the fixed code and the line_ranges updated to the
+    line numbers of the fixed code.
+
+    Like autopep8's fix_lines this repeats passes until the source no
+    longer changes (or there have been options.pep8_passes passes). If the
+    first pep8 check finds nothing to fix on the line_ranges, autopep8's
+    fixer isn't run at all.
+
+    """
+    line_ranges = LineRanges(line_ranges)
+
+    # autopep8 should not be restricted to a single line_range.
+    options = copy(options)
+    options.line_range = None
+
+    # Split into lines as autopep8 does, only on '\n' (str.splitlines also
+    # splits on e.g. form feeds, which would throw out the line numbers).
+    source_lines = io.StringIO(source_code).readlines()
+    original_newline = find_newline(source_lines)
+    fixed = ''.join(normalize_line_endings(source_lines, '\n'))
+
+    results = check_line_ranges(fixed, line_ranges, options)
+    if options.verbose:
+        clean = [r for r in line_ranges
+                 if not any(r[0] <= res['line'] <= r[1] for res in results)]
+        print('--->  skipping %s of %s line range(s), with nothing to fix'
+              % (len(clean), len(line_ranges)), file=sys.stderr)
+
+    previous_hashes = set()
+    passes = 0
+    long_line_ignore_cache = set()
+    while results and hash(fixed) not in previous_hashes:
+        if options.pep8_passes >= 0 and passes > options.pep8_passes:
+            break
+        passes += 1
+        previous_hashes.add(hash(fixed))
+
+        fix = FixPEP8LineRanges(line_ranges, '', options, contents=fixed,
+                                long_line_ignore_cache=long_line_ignore_cache)
+        # The first pass fixes the results of the check above.
+        fixed = fix.fix(results if passes == 1 else None)
+        line_ranges = fix.line_ranges
+
+    fixed_lines = io.StringIO(fixed).readlines()
+    fixed = ''.join(normalize_line_endings(fixed_lines, original_newline))
+    return fixed, line_ranges
+
+
+def check_line_ranges(source, line_ranges, options):
+    """Return the pep8 results on the line_ranges of source (with '\\n'
+    newlines) which autopep8 would try to fix, from a single pep8 check."""
+    pep8_options = dict((name, getattr(options, name))
+                        for name in PEP8_OPTIONS if hasattr(options, name))
+    source_lines = io.StringIO(source).readlines()
+    results = [r for r in _execute_pep8(pep8_options, source_lines)
+               if r['line'] in line_ranges]
+    return list(filter_results(source=source, results=results,
+                               aggressive=options.aggressive))
+
+
+def fix_line_ranges_by_block(source_code, line_ranges, options):
+    """Like fix_line_ranges, but autopep8 is only passed the top-level
+    statements (functions, classes, ...) enclosing each line range, rather
+    than all of source_code.
+
+    The statements before and after these are included as context (e.g. so
+    blank lines between functions are checked), each slice of the source
+    is fixed separately and spliced back in. If source_code can't be split
+    into slices (e.g. it doesn't parse) this fixes all of source_code.
+
+    """
+    lines = io.StringIO(source_code).readlines()
+    slices = enclosing_slices(source_code, line_ranges)
+    if slices is None:
+        return fix_line_ranges(source_code, line_ranges, options)
+
+    fixed, fixed_ranges, pos = [], [], 0
+    for start, end, ranges in slices:
+        fixed.extend(lines[pos:start - 1])
+        offset = len(fixed)
+        part, ranges = fix_line_ranges(
+            ''.join(lines[start - 1:end]),
+            [(s - start + 1, e - start + 1) for s, e in ranges], options)
+        fixed.extend(io.StringIO(part).readlines())
+        fixed_ranges.extend((s + offset, e + offset) for s, e in ranges)
+        pos = end
+    fixed.extend(lines[pos:])
+    return ''.join(fixed), LineRanges(fixed_ranges)
+
+
+def enclosing_slices(source_code, line_ranges):
+    """Return a list of (start, end, line_ranges) of the slices of
+    source_code to fix for line_ranges, or None if this isn't possible.
+
+    Each slice is the top-level statements enclosing some of the
+    line_ranges, with one statement before and after as context (overlapping
+    slices are merged).
+
+    """
+    import ast
+    try:
+        tree = ast.parse(source_code)
+    except (SyntaxError, TypeError, ValueError):
+        return None
+
+    # The line numbers of ast (like autopep8's) only count '\n' newlines.
+    lines = io.StringIO(source_code).readlines()
+    # The first line of each top-level statement (including decorators).
+    starts = set([1])
+    for node in tree.body:
+        decorators = getattr(node, 'decorator_list', [])
+        starts.add(min([node.lineno] + [d.lineno for d in decorators]))
+    starts = sorted(starts)
+    ends = [s - 1 for s in starts[1:]] + [len(lines)]
+
+    def block(line):
+        return max(bisect_right(starts, line) - 1, 0)
+
+    slices = []
+    for start, end in sorted((max(s, 1), e) for s, e in line_ranges):
+        first = max(block(start) - 1, 0)
+        last = min(block(end) + 1, len(starts) - 1)
+        if slices and starts[first] <= slices[-1][1]:
+            slices[-1][1] = max(slices[-1][1], ends[last])
+            slices[-1][2].append((start, end))
+        else:
+            slices.append([starts[first], ends[last], [(start, end)]])
+
+    for s in slices:
+        # Don't end a slice (in the middle of the file) with blank lines,
+        # which would look like they were at the end of the file.
+        while s[0] < s[1] < len(lines) and not lines[s[1] - 1].strip():
+            s[1] -= 1
+        # The start of a statement may be misreported, e.g. multiline
+        # strings on older pythons, so check each slice parses.
+        try:
+            ast.parse(''.join(lines[s[0] - 1:s[1]]))
+        except SyntaxError:
+            return None
+    return [tuple(s) for s in slices]
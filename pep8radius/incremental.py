@@ -0,0 +1,104 @@
+"""This module defines IncrementalState, the state kept between runs by
+pep8radius --incremental.
+
+For each file which was clean (fixing its modified lines changed nothing)
+this records its modification time, size and hash, and the line ranges
+which were checked. On the next run (against the same branch point, with
+the same options and tool versions) the files which haven't changed since
+are skipped, without asking version control for their diff or fixing them.
+
+If the branch point, options or versions are different the state is
+discarded (so this falls back to a full run).
+
+"""
+
+import codecs
+import hashlib
+import json
+import os
+
+STATE_FILE = '.incremental.json'
+
+
+class IncrementalState(object):
+
+    """The clean files of the previous run, stored as json in path."""
+
+    def __init__(self, path, key):
+        self.path = path
+        self.key = key
+        self.files = {}
+        self._saved = 0.0
+        try:
+            with codecs.open(path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (IOError, ValueError):
+            return
+        if state.get('key') == key:
+            self.files = state.get('files', {})
+            self._saved = state.get('saved', 0.0)
+
+    @classmethod
+    def for_radius(cls, r):
+        """Return the IncrementalState of the Radius r (in its cache
+        directory)."""
+        from pep8radius.cache import DEFAULT_CACHE_DIR, fingerprint
+        directory = os.path.join(r.root or r.cwd,
+                                 r.options.cache_dir or DEFAULT_CACHE_DIR)
+        key = '\0'.join([fingerprint(r.options), r.rev])
+        key = hashlib.sha1(key.encode('utf-8')).hexdigest()
+        return cls(os.path.join(directory, STATE_FILE), key)
+
+    def is_clean(self, file_name):
+        """Whether file_name was clean and hasn't changed since."""
+        entry = self.files.get(file_name)
+        if entry is None:
+            return False
+        try:
+            st = os.stat(file_name)
+        except OSError:
+            return False
+        if st.st_size != entry['size']:
+            return False
+        # If modified around when the state was saved, the mtime may not
+        # have changed, so we check the hash.
+        if st.st_mtime == entry['mtime'] and st.st_mtime < self._saved - 1:
+            return True
+        if _hash(file_name) != entry['hash']:
+            return False
+        entry['mtime'] = st.st_mtime
+        return True
+
+    def clean(self, file_name, line_ranges):
+        """Record that file_name is clean (over line_ranges)."""
+        try:
+            st = os.stat(file_name)
+            self.files[file_name] = {'mtime': st.st_mtime,
+                                     'size': st.st_size,
+                                     'hash': _hash(file_name),
+                                     'ranges': [list(r) for r in line_ranges]}
+        except (IOError, OSError):  # pragma: no cover
+            self.forget(file_name)
+
+    def forget(self, file_name):
+        """Record that file_name is not clean."""
+        self.files.pop(file_name, None)
+
+    def save(self):
+        """Write the state to path (atomically)."""
+        from time import time
+        from tempfile import mkstemp
+        from pep8radius.cache import make_cache_directory, _replace
+
+        directory = os.path.dirname(self.path)
+        make_cache_directory(directory)
+        state = {'key': self.key, 'saved': time(), 'files': self.files}
+        fd, temp = mkstemp(dir=directory, suffix='.tmp')
+        with os.fdopen(fd, 'w') as f:
+            json.dump(state, f)
+        _replace(temp, self.path)
+
+
+def _hash(file_name):
+    with open(file_name, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
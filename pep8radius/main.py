@@ -6,14 +6,6 @@ from __future__ import print_function
 import os
 import sys
 
-try:
-    from configparser import ConfigParser as SafeConfigParser, NoSectionError
-except ImportError:  # py2, pragma: no cover
-    from ConfigParser import SafeConfigParser, NoSectionError
-
-from pep8radius.radius import Radius, RadiusFromDiff
-from pep8radius.shell import CalledProcessError  # with 2.6 compat
-
 __version__ = version = '0.9.2'
 
 
@@ -31,15 +23,6 @@ PROJECT_CONFIG = ('setup.cfg', 'tox.ini', '.pep8')
 def main(args=None, vc=None, cwd=None, apply_config=False):
     """PEP8 clean only the parts of the files touched since the last commit, a
     previous commit or branch."""
-    import signal
-
-    try:  # pragma: no cover
-        # Exit on broken pipe.
-        signal.signal(signal.SIGPIPE, signal.SIG_DFL)
-    except AttributeError:  # pragma: no cover
-        # SIGPIPE is not available on Windows.
-        pass
-
     try:
         if args is None:
             args = []
@@ -60,16 +43,35 @@ def main(args=None, vc=None, cwd=None, apply_config=False):
                     code=code, description=description))
             return 0
 
+        from pep8radius.radius import Radius
+        from pep8radius.shell import CalledProcessError  # with 2.6 compat
+        arguments = args
         try:
             try:
-                args = parse_args(args, apply_config=apply_config)
+                args = parse_args(args, apply_config=apply_config, cwd=cwd)
             except TypeError:
                 pass  # args is already a Namespace (testing)
+            if args.daemon:  # pragma: no cover
+                from pep8radius.daemon import serve
+                return serve(args.socket)
+            if args.profile or args.profile_json or args.profile_stats:
+                from pep8radius import profiling
+                profiling.start(stats=args.profile_stats)
+            if args.repo or args.manifest:
+                from pep8radius.batch import batch_repos, fix_many
+                status = fix_many(batch_repos(args, cwd=cwd), args,
+                                  arguments=arguments,
+                                  apply_config=apply_config)
+                _print_profile(args, cwd=cwd)
+                return status
             if args.from_diff:  # pragma: no cover
-                r = Radius.from_diff(args.from_diff.read(),
+                r = Radius.from_diff(args.from_diff,
                                      options=args, cwd=cwd)
             else:
                 r = Radius(rev=args.rev, options=args, vc=vc, cwd=cwd)
+                if args.watch:  # pragma: no cover
+                    from pep8radius.watch import Watcher
+                    return Watcher(r, interval=args.watch_interval).run()
         except NotImplementedError as e:  # pragma: no cover
             print(e)
             return 1
@@ -80,12 +82,32 @@ def main(args=None, vc=None, cwd=None, apply_config=False):
             return c.returncode
 
         any_changes = r.fix()
+        _print_profile(args, cwd=cwd)
         if any_changes and args.error_status:
             return 1
         return 0
 
     except KeyboardInterrupt:  # pragma: no cover
         return 1
+    finally:
+        from pep8radius import profiling
+        profiling.stop()  # e.g. if there was an error
+
+
+def _print_profile(args, cwd=None):
+    """Stop the profiler (if running) and print or save its report."""
+    from pep8radius import profiling
+    profiler = profiling.stop()
+    if profiler is None:
+        return
+    profiler.print_report(file=sys.stderr)
+    if args.profile_json:
+        import json
+        with open(os.path.join(cwd or os.getcwd(), args.profile_json),
+                  'w') as f:
+            json.dump(profiler.report(), f, indent=2, sort_keys=True)
+    for path in profiler.dump_stats(cwd or os.getcwd()):
+        print('Saved cProfile stats to %s' % path, file=sys.stderr)
 
 
 def create_parser():
@@ -117,6 +139,16 @@ def create_parser():
                              " any fixes")
     parser.add_argument('-i', '--in-place', action='store_true',
                         help="make the fixes in place; modify the files")
+    parser.add_argument('-j', '--jobs', metavar='n', default=1, type=int,
+                        help='number of parallel jobs (files fixed at once); '
+                             'match CPU count if value is less than 1')
+    parser.add_argument('--format', choices=['text', 'jsonl'],
+                        default='text',
+                        help='print each file\'s result as a line of json '
+                        '(its modified and fixed line ranges, lines added '
+                        'and removed, time in each stage, and with --diff '
+                        'the diff) as soon as it is fixed, rather than text '
+                        '(default: %(default)s)')
     parser.add_argument('--no-color', action='store_true',
                         help='do not print diffs in color '
                              '(default is to use color)')
@@ -130,11 +162,52 @@ def create_parser():
                              " control, just pass in a diff; "
                              "the modified lines will be fixed")
 
+    parser.add_argument('--incremental', action='store_true',
+                        help='skip the files which were clean in the '
+                        'previous --incremental run (against the same rev, '
+                        'with the same options) and have not changed since')
+    parser.add_argument('--git-batch', action='store_true',
+                        help='git only: read the files at rev through a '
+                        'single git cat-file --batch process and diff them '
+                        'in-process, rather than calling git diff')
+
+    parser.add_argument('--repo', action='append', metavar='path',
+                        help='fix this repository (rather than the one '
+                        'containing the working directory), pass several '
+                        'times to fix many repositories in one process')
+    parser.add_argument('--manifest', metavar='filename',
+                        help='fix each repository listed in this file, one '
+                        '"path [rev]" per line (see --repo)')
+
+    parser.add_argument('--watch', action='store_true',
+                        help='fix the modified files, then keep running and '
+                        'refix each tracked file when it is saved')
+    parser.add_argument('--watch-interval', metavar='seconds', type=float,
+                        default=0.5,
+                        help='how often --watch checks for saved files '
+                        '(default: %(default)s)')
+
+    parser.add_argument('--daemon', action='store_true',
+                        help='run as a daemon, answering requests from '
+                             'pep8radius-client (from any directory)')
+    parser.add_argument('--socket', metavar='path',
+                        help='unix socket for the daemon (default: '
+                             '$PEP8RADIUS_SOCKET, or a file in '
+                             '$XDG_RUNTIME_DIR or a private directory in the '
+                             'temp directory)')
+
     ap = parser.add_argument_group('pep8', 'Pep8 options to pass to autopep8.')
     ap.add_argument('-p', '--pep8-passes', metavar='n',
                     default=-1, type=int,
                     help='maximum number of additional pep8 passes '
                     '(default: infinite)')
+    ap.add_argument('--fix-blocks', action='store_true',
+                    help='only pass autopep8 the top-level statements '
+                    '(functions, classes, ...) enclosing the modified lines, '
+                    'rather than the whole file')
+    ap.add_argument('--merge-gap', metavar='n', default=0, type=int,
+                    help='fix modified line ranges at most n lines apart as '
+                    'one range (default: %(default)s)')
     ap.add_argument('-a', '--aggressive', action='count', default=0,
                     help='enable non-whitespace changes; '
                     'multiple -a result in more aggressive changes')
@@ -188,6 +261,33 @@ def create_parser():
                     'if not passed, defaults are updated with any '
                     "config files in the project's root directory")
 
+    from pep8radius.cache import DEFAULT_CACHE_DIR, DEFAULT_CACHE_SIZE
+    ca = parser.add_argument_group('cache',
+                                   'Reuse the fixes of previous runs (for the '
+                                   'same code and options).')
+    ca.add_argument('--cache', action='store_true',
+                    help='cache fixes in the project directory '
+                    '(in %s)' % DEFAULT_CACHE_DIR)
+    ca.add_argument('--cache-dir', metavar='dir',
+                    help='cache fixes in this directory (implies --cache)')
+    ca.add_argument('--cache-size', metavar='n', type=int,
+                    default=DEFAULT_CACHE_SIZE,
+                    help='maximum size of the cache in MB '
+                    '(default: %(default)s)')
+
+    pr = parser.add_argument_group('profile',
+                                   'Find where pep8radius spends its time.')
+    pr.add_argument('--profile', action='store_true',
+                    help='print the time spent in each stage (version '
+                    'control, autopep8, docformatter, yapf, diff and io), '
+                    'and on each file, to stderr')
+    pr.add_argument('--profile-json', metavar='filename',
+                    help='write the profile as json to this file '
+                    '(implies --profile)')
+    pr.add_argument('--profile-stats', metavar='n', type=int, default=0,
+                    help='save the cProfile stats of the n slowest files '
+                    '(as pep8radius-*.prof) (implies --profile)')
+
     yp = parser.add_argument_group('yapf',
                                    'Options for yapf, alternative to autopep8. '
                                    'Currently any other options are ignored.')
@@ -201,11 +301,12 @@ def create_parser():
     return parser
 
 
-def parse_args(arguments=None, root=None, apply_config=False):
+def parse_args(arguments=None, root=None, apply_config=False, cwd=None):
     """Parse the arguments from the CLI.
 
     If apply_config then we first look up and apply configs using
-    apply_config_defaults.
+    apply_config_defaults (the local config files are looked up in root, or
+    the root of the repository containing cwd).
 
     """
     if arguments is None:
@@ -214,7 +315,7 @@ def parse_args(arguments=None, root=None, apply_config=False):
     parser = create_parser()
     args = parser.parse_args(arguments)
     if apply_config:
-        parser = apply_config_defaults(parser, args, root=root)
+        parser = apply_config_defaults(parser, args, root=root, cwd=cwd)
         args = parser.parse_args(arguments)
 
     # sanity check args (from autopep8)
@@ -240,28 +341,62 @@ def parse_args(arguments=None, root=None, apply_config=False):
     return args
 
 
-def apply_config_defaults(parser, args, root):
+def apply_config_defaults(parser, args, root, cwd=None):
     """Update the parser's defaults from either the arguments' config_arg or
-    the config files given in config_files(root)."""
+    the config files given in config_files(root), where root defaults to
+    the root of the repository containing cwd."""
     if root is None:
         try:
             from pep8radius.vcs import VersionControl
-            root = VersionControl.which().root_dir()
+            root = VersionControl.which(cwd=cwd).cached_root_dir(cwd=cwd)
         except NotImplementedError:
             pass  # don't update local, could be using as module
 
-    config = SafeConfigParser()
-    config.read(args.global_config)
+    config_files = [args.global_config]
     if root and not args.ignore_local_config:
-        config.read(local_config_files(root))
+        config_files.extend(local_config_files(root))
+    parser.set_defaults(**read_config(config_files))
+    return parser
+
+
+# The defaults read from each list of config files (and their modification
+# times), so the daemon doesn't reparse unchanged config files.
+_CONFIG_CACHE = {}
 
+
+def read_config(config_files):
+    """Return a dict of the options in the pep8 section of the config_files
+    (those which exist), the later files taking precedence."""
+    key = []
+    for path in config_files:
+        try:
+            st = os.stat(path)
+            key.append((path, st.st_mtime, st.st_size))
+        except OSError:
+            key.append((path, None, None))
+    key = tuple(key)
+    defaults = _CONFIG_CACHE.get(key)
+    if defaults is None:
+        if len(_CONFIG_CACHE) >= 64:
+            _CONFIG_CACHE.clear()
+        defaults = _CONFIG_CACHE[key] = _read_config(config_files)
+    return dict(defaults)
+
+
+def _read_config(config_files):
     try:
-        defaults = dict((k.lstrip('-').replace('-', '_'), v)
-                        for k, v in config.items("pep8"))
-        parser.set_defaults(**defaults)
+        from configparser import ConfigParser as SafeConfigParser
+        from configparser import NoSectionError
+    except ImportError:  # py2, pragma: no cover
+        from ConfigParser import SafeConfigParser, NoSectionError
+
+    config = SafeConfigParser()
+    config.read(config_files)
+    try:
+        return dict((k.lstrip('-').replace('-', '_'), v)
+                    for k, v in config.items("pep8"))
     except NoSectionError:
-        pass  # just do nothing, potentially this could raise ?
-    return parser
+        return {}  # just do nothing, potentially this could raise ?
 
 
 def local_config_files(root):
@@ -278,6 +413,8 @@ def _split_comma_separated(string):
 def _main(args=None, vc=None, cwd=None):  # pragma: no cover
     if args is None:
         args = sys.argv[1:]
+    from pep8radius.shell import exit_on_broken_pipe
+    exit_on_broken_pipe()
     return sys.exit(main(args=args, vc=vc, cwd=cwd, apply_config=True))
 
 
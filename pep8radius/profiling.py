@@ -0,0 +1,182 @@
+"""This module defines Profiler, which records where pep8radius spends its
+time (used by the --profile option).
+
+The time is broken down into stages: version control calls ('vcs'),
+autopep8, docformatter, yapf, the cache, diffing and file io ('io'), both
+in total and for each file. The stage context manager (which is wrapped
+around each of these in pep8radius) does nothing unless a Profiler has been
+started, so is (almost) free when not profiling.
+
+Separately, record_stages records the time of each stage of a block (in
+the current thread), this is used for the per file times of --format jsonl.
+
+"""
+
+from __future__ import print_function
+
+from contextlib import contextmanager
+from threading import local
+from time import time
+
+
+_active = None
+_local = local()  # the stage times being recorded (by this thread)
+
+
+def start(stats=0):
+    """Start and return a Profiler, if stats also keep the cProfile stats of
+    the stats slowest files."""
+    global _active
+    _active = Profiler(stats=stats)
+    return _active
+
+
+def stop():
+    """Stop and return the active Profiler (or None)."""
+    global _active
+    profiler, _active = _active, None
+    if profiler is not None:
+        profiler.end = time()
+    return profiler
+
+
+def active():
+    """Return the active Profiler, or None if not profiling."""
+    return _active
+
+
+@contextmanager
+def stage(name):
+    """Time the block as stage name, if profiling (or recording stages)."""
+    profiler = _active
+    times = getattr(_local, 'times', None)
+    if profiler is None and times is None:
+        yield
+        return
+    t = time()
+    try:
+        yield
+    finally:
+        elapsed = time() - t
+        if profiler is not None:
+            profiler.add(name, elapsed)
+        if times is not None:
+            times[name] = times.get(name, 0.0) + elapsed
+
+
+@contextmanager
+def record_stages():
+    """Record the time spent in each stage of the block (by this thread),
+    yields the dict of stage name to seconds."""
+    previous = getattr(_local, 'times', None)
+    _local.times = times = {}
+    try:
+        yield times
+    finally:
+        _local.times = previous
+
+
+@contextmanager
+def profile_file(file_name, line_ranges):
+    """Time the block as fixing file_name, if profiling."""
+    if _active is None:
+        yield
+    else:
+        with _active.file(file_name, line_ranges):
+            yield
+
+
+class Profiler(object):
+
+    """Records the time and number of calls of each stage, overall and for
+    each file."""
+
+    def __init__(self, stats=0):
+        self.stats = stats
+        self.stages = {}  # name -> [time, calls]
+        self.files = []
+        self.start = time()
+        self.end = None
+        self._file = None
+        self._profiles = []  # (time, file_name, cProfile.Profile)
+
+    def add(self, name, elapsed):
+        """Record a call of the stage name which took elapsed seconds."""
+        stages = [self.stages]
+        if self._file is not None:
+            stages.append(self._file['stages'])
+        for s in stages:
+            t = s.setdefault(name, [0.0, 0])
+            t[0] += elapsed
+            t[1] += 1
+
+    @contextmanager
+    def file(self, file_name, line_ranges):
+        """Attribute the stages of the block to file_name."""
+        record = {'file': file_name, 'ranges': len(line_ranges), 'time': 0.0,
+                  'stages': {}}
+        self._file = record
+        prof = None
+        if self.stats:
+            import cProfile
+            prof = cProfile.Profile()
+            prof.enable()
+        t = time()
+        try:
+            yield
+        finally:
+            record['time'] = time() - t
+            if prof is not None:
+                prof.disable()
+                self._profiles.append((record['time'], file_name, prof))
+                self._profiles.sort(key=lambda p: -p[0])
+                del self._profiles[self.stats:]
+            self._file = None
+            self.files.append(record)
+
+    def report(self):
+        """Return the results as a dict (which can be dumped to json)."""
+        def stages(s):
+            return dict((name, {'time': t, 'calls': calls})
+                        for name, (t, calls) in s.items())
+        end = self.end if self.end is not None else time()
+        return {'time': end - self.start,
+                'stages': stages(self.stages),
+                'files': [{'file': f['file'], 'ranges': f['ranges'],
+                           'time': f['time'], 'stages': stages(f['stages'])}
+                          for f in self.files]}
+
+    def print_report(self, file=None):
+        """Print the time of each stage, and each file (slowest first)."""
+        report = self.report()
+        names = sorted(report['stages'],
+                       key=lambda s: -report['stages'][s]['time'])
+
+        print('pep8radius profile: %.3fs' % report['time'], file=file)
+        print('%-14s %9s %7s' % ('stage', 'time', 'calls'), file=file)
+        for name in names:
+            s = report['stages'][name]
+            print('%-14s %8.3fs %7d' % (name, s['time'], s['calls']),
+                  file=file)
+
+        if report['files']:
+            print('', file=file)
+            print('%9s %7s  %s' % ('time', 'ranges', 'file'), file=file)
+        for f in sorted(report['files'], key=lambda f: -f['time']):
+            stages = f['stages']
+            breakdown = ', '.join('%s %.3fs' % (name, stages[name]['time'])
+                                  for name in names if name in stages)
+            print('%8.3fs %7d  %s (%s)' % (f['time'], f['ranges'], f['file'],
+                                           breakdown), file=file)
+
+    def dump_stats(self, directory):
+        """Write the cProfile stats of the slowest files to directory,
+        returns the paths of these files."""
+        import os
+        paths = []
+        for i, (_, file_name, prof) in enumerate(self._profiles, start=1):
+            name = os.path.basename(file_name).replace('.py', '')
+            path = os.path.join(directory, 'pep8radius-%s-%s.prof' % (i, name))
+            prof.dump_stats(path)
+            paths.append(path)
+        return paths
@@ -1,6 +1,6 @@
 """This module defines the Radius class, which is where the "meat" of the
-pep8radius machinery is done. The important methods are fix, fix_file and
-fix_line_range.
+pep8radius machinery is done. The important methods are fix (and iter_fix),
+fix_file and fix_line_range.
 
 The vc attribute is a subclass of VersionControl defined in the vcs
 module (provides helper methods for the different vcs e.g. git).
@@ -9,6 +9,7 @@ module (provides helper methods for the different vcs e.g. git).
 
 from __future__ import print_function
 
+from collections import namedtuple
 from sys import version_info
 
 
@@ -16,6 +17,13 @@ if version_info[0] > 2:  # py3, pragma: no cover
     basestring = str
 
 
+# The result of fixing a file: the diff, the number of lines changed in it,
+# the time (in seconds) taken to fix the line_ranges of file_name and a dict
+# of the time spent in each stage (e.g. 'autopep8', see profiling).
+FixResult = namedtuple('FixResult', ['file_name', 'line_ranges', 'diff',
+                                     'lines_changed', 'time', 'stages'])
+
+
 class Radius(object):
 
     """PEP8 clean only the parts of the files touched since the last commit, a
@@ -26,37 +34,69 @@ class Radius(object):
 
         from pep8radius.vcs import VersionControl
         if vc is None:
-            vc = VersionControl.which()
+            vc = VersionControl.which(cwd=self.cwd)
         elif isinstance(vc, basestring):
             vc = VersionControl.from_string(vc)
         else:
             assert(issubclass(vc, VersionControl))
+        if getattr(self.options, 'git_batch', False):
+            from pep8radius.vcs import Git, GitBatch
+            if vc is Git:
+                vc = GitBatch
         self.vc = vc(cwd=self.cwd)
 
         self.root = self.vc.root
         self.rev = self.vc.branch_point(rev)
+        self._modified_lines = None
+        self.cache = self._init_cache()
         # Note: This may raise a CalledProcessError, if it does it means
         # that there's been an error with the version control command.
         filenames = self.vc.get_filenames_diff(self)
         self.filenames_diff = self._clean_filenames(filenames)
+        self.state = self._init_state()
 
     def _init_options(self, options, cwd):
         from os import getcwd
         self.cwd = cwd or getcwd()
 
         # pep8radius specific options
+        # Note: options is copied, as we change the autopep8 options below.
+        from copy import copy
         from pep8radius.main import parse_args
-        self.options = options if options else parse_args([''])
+        self.options = copy(options) if options else parse_args([''])
         self.verbose = self.options.verbose
         self.in_place = self.options.in_place
         self.diff = self.options.diff
         self.color = not self.options.no_color
+        self.jobs = self.options.jobs
+        self.format = getattr(self.options, 'format', 'text')
+        self.incremental = self.options.incremental
 
         # autopep8 specific options
         self.options.verbose = max(0, self.options.verbose - 1)
         self.options.in_place = False
         self.options.diff = False
 
+    def _init_cache(self):
+        """Return a FixCache if the cache (or cache_dir) option is set,
+        otherwise None."""
+        if not (self.options.cache or self.options.cache_dir):
+            return None
+        import os
+        from pep8radius.cache import FixCache, DEFAULT_CACHE_DIR
+        directory = os.path.join(self.root or self.cwd,
+                                 self.options.cache_dir or DEFAULT_CACHE_DIR)
+        return FixCache(directory,
+                        max_size=int(self.options.cache_size) * 1024 ** 2)
+
+    def _init_state(self):
+        """Return the IncrementalState if the incremental option is set,
+        otherwise None."""
+        if not self.incremental:
+            return None
+        from pep8radius.incremental import IncrementalState
+        return IncrementalState.for_radius(self)
+
     def _clean_filenames(self, filenames):
         import os
         if self.options.exclude:
@@ -73,36 +113,56 @@ class Radius(object):
         return RadiusFromDiff(diff=diff, options=options, cwd=cwd)
 
     def modified_lines(self, file_name):
-        return self.vc.modified_lines(self, file_name)
+        """Returns the line ranges of file_name which have been changed.
 
-    def fix(self):
+        The first call gets the diff of every file from version control at
+        once, subsequent calls look up file_name in that.
+
+        """
+        import os
+        if self._modified_lines is None:
+            self._modified_lines = self.vc.get_modified_lines(self)
+        try:
+            return self._modified_lines[os.path.relpath(file_name,
+                                                        self.root)]
+        except KeyError:
+            # e.g. a deleted file, or we failed to parse the diff.
+            return self.vc.modified_lines(self, file_name)
+
+    def fix(self, jobs=None):
         """Runs fix_file on each modified file.
 
-        - Prints progress and diff depending on options.
+        - Prints progress and diff depending on options, each diff is
+        printed as soon as that file has been fixed.
         - Returns True if there were any changes
+        - If jobs (defaults to the --jobs option) is greater than 1, files
+        are fixed in a pool of that many processes (less than 1 means one
+        per CPU). Output is in the same order as the sequential run.
 
         """
-        from pep8radius.diff import print_diff, udiff_lines_fixed
+        return self._print_results(self.iter_fix(jobs=jobs),
+                                   len(self.filenames_diff))
 
-        n = len(self.filenames_diff)
-        _maybe_print('Applying autopep8 to touched lines in %s file(s).' % n)
+    def _print_results(self, results, n):
+        """Print the diff (depending on options) of each of the n FixResults
+        in results, and a summary, returns True if there were any
+        changes."""
+        from pep8radius.diff import print_diff
 
         any_changes = False
         total_lines_changed = 0
-        pep8_diffs = []
-        for i, file_name in enumerate(self.filenames_diff, start=1):
-            _maybe_print('%s/%s: %s: ' % (i, n, file_name), end='')
-            _maybe_print('', min_=2)
-
-            p_diff = self.fix_file(file_name)
-            lines_changed = udiff_lines_fixed(p_diff) if p_diff else 0
-            total_lines_changed += lines_changed
+        for result in results:
+            total_lines_changed += result.lines_changed
 
-            if p_diff:
+            if result.diff:
                 any_changes = True
-                if self.diff:
-                    pep8_diffs.append(p_diff)
+            if self.format == 'jsonl':
+                print_record(result, diff=self.diff)
+            elif result.diff and self.diff:
+                print_diff(result.diff, color=self.color)
 
+        if self.format == 'jsonl':
+            return any_changes
         if self.in_place:
             _maybe_print('pep8radius fixed %s lines in %s files.'
                          % (total_lines_changed, n),
@@ -112,12 +172,86 @@ class Radius(object):
                          % (total_lines_changed, n),
                          verbose=self.verbose)
 
-        if self.diff:
-            for diff in pep8_diffs:
-                print_diff(diff, color=self.color)
+        if self.cache is not None:
+            _maybe_print('pep8radius cache: %s hit(s), %s miss(es).'
+                         % (self.cache.hits, self.cache.misses),
+                         verbose=self.verbose)
 
         return any_changes
 
+    def iter_fix(self, jobs=None):
+        """Fix each modified file, yielding a FixResult for each (in the order
+        of filenames_diff) as soon as it's done.
+
+        See fix for the jobs argument.
+
+        """
+        jobs = _num_jobs(self.jobs if jobs is None else jobs)
+        to_fix, skip = self._files_to_fix()
+        if jobs > 1 and len(to_fix) > 1:
+            results = self._fix_files_parallel(jobs, to_fix)
+        else:
+            results = (self._fix_file_result(f) for f in to_fix)
+        return self._iter_results(results, skip)
+
+    def _files_to_fix(self):
+        """Return the list of files to fix, and the set of those skipped as
+        they're clean (with the incremental option)."""
+        n = len(self.filenames_diff)
+        _maybe_print('Applying autopep8 to touched lines in %s file(s).' % n)
+
+        to_fix, skip = self.filenames_diff, set()
+        if self.state is not None:
+            # Skip the files which were clean and haven't changed since.
+            skip = set(f for f in to_fix if self.state.is_clean(f))
+            to_fix = [f for f in to_fix if f not in skip]
+            if skip and self._modified_lines is None:
+                import os
+                self._modified_lines = self.vc.get_modified_lines(
+                    self, [os.path.relpath(f, self.root) for f in to_fix])
+        return to_fix, skip
+
+    def _iter_results(self, results, skip):
+        """Yield the FixResult of each file in filenames_diff, from results
+        (the FixResult of each file not in skip, in order)."""
+        try:
+            n = len(self.filenames_diff)
+            for i, file_name in enumerate(self.filenames_diff, start=1):
+                _maybe_print('%s/%s: %s: ' % (i, n, file_name), end='')
+                _maybe_print('', min_=2)
+
+                if file_name in skip:
+                    yield FixResult(file_name, [], '', 0, 0.0, {})
+                    continue
+                result = next(results)
+                if self.state is not None:
+                    if result.diff:
+                        self.state.forget(file_name)
+                    else:
+                        self.state.clean(file_name, result.line_ranges)
+                yield result
+
+            if self.cache is not None:
+                self.cache.prune()
+            if self.state is not None:
+                self.state.save()
+        finally:
+            # e.g. stop the git cat-file process of GitBatch
+            self.close()
+
+    def close(self):
+        """Release the resources of the version control (it can still be
+        used, e.g. by modified_lines, afterwards)."""
+        vc = getattr(self, 'vc', None)
+        if vc is not None:
+            vc.close()
+
+    def fix_async(self, executor=None):
+        """Return a coroutine (python 3.5+) which fixes each modified file,
+        without blocking the event loop, see pep8radius.aio.fix_async."""
+        from pep8radius.aio import fix_async
+        return fix_async(self, executor=executor)
+
     def fix_file(self, file_name):
         """Apply autopep8 to the diff lines of a file.
 
@@ -126,13 +260,59 @@ class Radius(object):
         - Prints dots to show progress depending on options.
 
         """
+        return self._fix_file_result(file_name).diff
+
+    def _fix_file_result(self, file_name):
         # We hope that a CalledProcessError would have already raised
         # during the init if it were going to raise here.
         modified_lines = self.modified_lines(file_name)
 
-        return fix_file(file_name, modified_lines, self.options,
-                        in_place=self.in_place, diff=True,
-                        verbose=self.verbose, cwd=self.cwd)
+        from pep8radius.profiling import profile_file
+        with profile_file(file_name, modified_lines):
+            return fix_file_result(file_name, modified_lines, self.options,
+                                   in_place=self.in_place,
+                                   verbose=self.verbose, cwd=self.cwd,
+                                   cache=self.cache)
+
+    def _fix_files_parallel(self, jobs, file_names):
+        """Yield the FixResult of each of file_names (in order), fixing them
+        in a pool of jobs processes."""
+        from multiprocessing import Pool
+
+        args = self._fix_file_args(file_names)
+        # The workers mustn't inherit the pipes of e.g. git cat-file.
+        self.close()
+        pool = Pool(min(jobs, len(args)))
+        try:
+            for result in self._count_hits(pool.imap(_fix_file_star, args)):
+                yield result
+        finally:
+            pool.close()
+            pool.join()
+
+    def _fix_file_args(self, file_names):
+        """Return the arguments of _fix_file_star for each of file_names.
+
+        The modified lines are found here, so that only the fixing (and not
+        the calls to version control) happens in the workers.
+
+        """
+        from copy import copy
+        # Note: from_diff is an open file so can't be passed to the workers.
+        options = copy(self.options)
+        options.from_diff = None
+        return [(file_name, self.modified_lines(file_name), options,
+                 self.in_place, self.cwd, self.cache)
+                for file_name in file_names]
+
+    def _count_hits(self, results):
+        """Yield the FixResult of each of the (result, hits, misses) returned
+        by _fix_file_star, adding the hits and misses to the cache's."""
+        for result, hits, misses in results:
+            if self.cache is not None:
+                self.cache.hits += hits
+                self.cache.misses += misses
+            yield result
 
 
 class RadiusFromDiff(Radius):
@@ -141,67 +321,195 @@ class RadiusFromDiff(Radius):
     control."""
 
     def __init__(self, diff, options=None, cwd=None):
-        import re
+        """diff is the text of the diff, or a file object (e.g. stdin) which
+        is parsed as it's read."""
+        from pep8radius.diff import iter_udiff
         self._init_options(options, cwd=cwd)
 
-        # grabbing the filenames from a diff
-        # TODO move to diff.py ?
-        start_re = '--- .*?/(.*?)\s*\n\+\+\+ .*?'
-        split = re.split(start_re, diff)
+        if isinstance(diff, basestring):
+            diff = diff.splitlines()
         self.root = cwd  # I'm not sure this is correct solution.
-        self.diffs = dict(zip(split[1::2],
-                              split[2::2]))  # file_name: diff
+        self._modified_lines = dict((f, lines)
+                                    for f, lines in iter_udiff(diff)
+                                    if f is not None)
 
-        self.filenames_diff = set(self.diffs.keys())
+        self.filenames_diff = sorted(self._modified_lines)
+        self.cache = self._init_cache()
+        self.state = None  # there's no branch point to compare against
 
     def modified_lines(self, file_name):
-        from pep8radius.diff import modified_lines_from_udiff
-        diff = self.diffs[file_name]
-        return list(modified_lines_from_udiff(diff))
+        return self._modified_lines[file_name]
 
 
 def fix_file(file_name, line_ranges, options=None, in_place=False,
-             diff=False, verbose=0, cwd=None):
+             diff=False, verbose=0, cwd=None, cache=None):
     """Calls fix_code on the source code from the passed in file over the given
     line_ranges.
 
     - If diff then this returns the udiff for the changes, otherwise
     returns the fixed code.
-    - If in_place the changes are written to the file.
+    - If in_place the changes are written to the file (only if there are
+    any, atomically, keeping its encoding, newlines and permissions).
+    - If cache (a FixCache) is passed this is used by fix_code.
 
     """
-    import codecs
-    from os import getcwd
+    import os
     from pep8radius.diff import get_diff
-    from pep8radius.shell import from_dir
-
-    if cwd is None:
-        cwd = getcwd()
-
-    with from_dir(cwd):
-        try:
-            with codecs.open(file_name, 'r', encoding='utf-8') as f:
-                original = f.read()
-        except IOError:
-            # Most likely the file has been removed.
-            # Note: it would be nice if we could raise here, specifically
-            # for the case of passing in a diff when in the wrong directory.
-            return ''
+    from pep8radius.profiling import stage
 
-    fixed = fix_code(original, line_ranges, options, verbose=verbose)
-
-    if in_place:
-        with from_dir(cwd):
-            with codecs.open(file_name, 'w', encoding='utf-8') as f:
-                f.write(fixed)
+    # Note: we don't chdir to cwd, so that this is safe to call from threads.
+    path = os.path.join(cwd or os.getcwd(), file_name)
+    try:
+        with stage('io'):
+            with open(path, 'rb') as f:
+                data = f.read()
+            encoding = _source_encoding(data)
+            original = data.decode(encoding)
+    except IOError:
+        # Most likely the file has been removed.
+        # Note: it would be nice if we could raise here, specifically
+        # for the case of passing in a diff when in the wrong directory.
+        return ''
+
+    fixed = fix_code(original, line_ranges, options, verbose=verbose,
+                     cache=cache)
+
+    if in_place and fixed != original:
+        with stage('io'):
+            _write_atomic(path, fixed.encode(encoding))
+
+    if diff:
+        with stage('diff'):
+            return get_diff(original, fixed, file_name)
+    return fixed
 
-    return get_diff(original, fixed, file_name) if diff else fixed
 
+def _source_encoding(data):
+    """The encoding of the python source code data (bytes), from its BOM or
+    coding comment (PEP 263), defaulting to utf-8."""
+    import codecs
+    import re
+    if data.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+    for line in data.splitlines()[:2]:
+        match = re.match(br'^[ \t\f]*#.*?coding[:=][ \t]*([-\w.]+)', line)
+        if match:
+            try:
+                return codecs.lookup(match.group(1).decode('ascii')).name
+            except LookupError:
+                break
+    return 'utf-8'
+
+
+def _write_atomic(path, data):
+    """Replace the contents of the file path with data (bytes), by writing a
+    temporary file (with the same permissions) and renaming it over path.
+
+    If path is a symlink the file it points to is replaced (not the link),
+    and as with open this raises an IOError if the file isn't writable.
 
-def fix_code(source_code, line_ranges, options=None, verbose=0):
+    """
+    import errno
+    import os
+    import stat
+    from tempfile import mkstemp
+
+    path = os.path.realpath(path)
+    if not os.access(path, os.W_OK):
+        raise IOError(errno.EACCES, os.strerror(errno.EACCES), path)
+    directory, name = os.path.split(path)
+    fd, temp = mkstemp(dir=directory, prefix='.%s.' % name, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.chmod(temp, stat.S_IMODE(os.stat(path).st_mode))
+        try:
+            replace = os.replace
+        except AttributeError:  # py2, pragma: no cover
+            replace = os.rename
+        replace(temp, path)
+    except BaseException:
+        os.remove(temp)
+        raise
+
+
+def fix_file_result(file_name, line_ranges, options=None, in_place=False,
+                    verbose=0, cwd=None, cache=None):
+    """Calls fix_file (see its arguments), returning a FixResult."""
+    from time import time
+    from pep8radius.diff import udiff_lines_fixed
+    from pep8radius.profiling import record_stages
+
+    start = time()
+    with record_stages() as stages:
+        p_diff = fix_file(file_name, line_ranges, options, in_place=in_place,
+                          diff=True, verbose=verbose, cwd=cwd, cache=cache)
+    lines_changed = udiff_lines_fixed(p_diff) if p_diff else 0
+    return FixResult(file_name, line_ranges, p_diff, lines_changed,
+                     time() - start, stages)
+
+
+def result_record(result, diff=False):
+    """Return a dict (which can be dumped to json) of the FixResult result:
+    the file, its modified line ranges, the line ranges which needed fixing,
+    the number of lines added and removed, the time taken (in total and in
+    each stage) and (if diff) the diff."""
+    from pep8radius.diff import udiff_stats
+    added, removed, fixed_ranges = udiff_stats(result.diff)
+    record = {'file': result.file_name,
+              'ranges': [list(r) for r in result.line_ranges],
+              'fixed_ranges': [list(r) for r in fixed_ranges],
+              'added': added,
+              'removed': removed,
+              'time': result.time,
+              'stages': result.stages}
+    if diff:
+        record['diff'] = result.diff
+    return record
+
+
+def print_record(result, diff=False):
+    """Print the result_record of result as a line of json."""
+    import json
+    import sys
+    print(json.dumps(result_record(result, diff=diff), sort_keys=True))
+    sys.stdout.flush()
+
+
+def _num_jobs(jobs):
+    """The number of processes to fix files in, one per CPU if jobs is less
+    than 1 (and only one when profiling)."""
+    if jobs < 1:
+        from multiprocessing import cpu_count
+        jobs = cpu_count()
+    from pep8radius import profiling
+    if profiling.active() is not None:
+        jobs = 1  # the time spent in other processes isn't recorded
+    return jobs
+
+
+def _fix_file_star(args):
+    """Unpack args and call fix_file_result, returning the result and the
+    number of cache hits and misses (used by the process pool in
+    Radius.iter_fix)."""
+    file_name, line_ranges, options, in_place, cwd, cache = args
+    result = fix_file_result(file_name, line_ranges, options,
+                             in_place=in_place, cwd=cwd, cache=cache)
+    if cache is None:
+        return result, 0, 0
+    return result, cache.hits, cache.misses
+
+
+def fix_code(source_code, line_ranges, options=None, verbose=0, cache=None):
     '''Apply autopep8 over the line_ranges, returns the corrected code.
 
-    Note: though this is not checked for line_ranges should not overlap.
+    Note: overlapping and adjacent line_ranges are merged (as are those at
+    most options.merge_gap lines apart, see LineRanges).
+    Where autopep8 allows, the file is checked and fixed in one autopep8 run
+    (over all the line ranges) rather than once per line range.
+
+    If cache (a FixCache) is passed and contains the result, this is
+    returned without running autopep8, otherwise the result is stored in it.
 
     Example
     -------
@@ -215,18 +523,51 @@ def fix_code(source_code, line_ranges, options=None, verbose=0):
     if options is None:
         from pep8radius.main import parse_args
         options = parse_args()
+    from pep8radius.profiling import stage
+    from pep8radius.ranges import LineRanges
+    line_ranges = LineRanges(line_ranges,
+                             gap=getattr(options, 'merge_gap', 0))
+
+    if cache is not None:
+        with stage('cache'):
+            key = cache.key(source_code, line_ranges, options)
+            fixed = cache.get(key)
+        if fixed is None:
+            fixed = fix_code(source_code, line_ranges, options,
+                             verbose=verbose)
+            with stage('cache'):
+                cache.set(key, fixed)
+        return fixed
 
     if getattr(options, "yapf", False):
         from yapf.yapflib.yapf_api import FormatCode
-        result = FormatCode(source_code, style_config=options.style, lines=line_ranges)
+        with stage('yapf'):
+            result = FormatCode(source_code, style_config=options.style,
+                                lines=line_ranges)
         # yapf<0.3 returns diff as str, >=0.3 returns a tuple of (diff, changed)
         return result[0] if isinstance(result, tuple) else result
 
-    line_ranges = reversed(line_ranges)
+    try:
+        from pep8radius.fixer import fix_line_ranges, fix_line_ranges_by_block
+    except ImportError:  # autopep8 internals have changed, pragma: no cover
+        fix_line_ranges = None
+
+    if fix_line_ranges is not None:
+        if getattr(options, 'fix_blocks', False):
+            fix_line_ranges = fix_line_ranges_by_block
+        # Check and fix all the line ranges in a single autopep8 run, the
+        # ranges are updated to the line numbers of the fixed code.
+        with stage('autopep8'):
+            partial, line_ranges = fix_line_ranges(source_code, line_ranges,
+                                                   options)
+        fixed = docformatter_line_ranges(partial, line_ranges, options)
+        _maybe_print('.' * len(line_ranges), max_=1, verbose=verbose)
+        return fixed
+
+    partial = source_code
     # Apply line fixes "up" the file (i.e. in reverse) so that
     # fixes do not affect changes we're yet to make.
-    partial = source_code
-    for start, end in line_ranges:
+    for start, end in reversed(line_ranges):
         partial = fix_line_range(partial, start, end, options)
         _maybe_print('.', end='', max_=1, verbose=verbose)
     _maybe_print('', max_=1, verbose=verbose)
@@ -240,26 +581,48 @@ def fix_line_range(source_code, start, end, options):
     # TODO confirm behaviour outside range (indexing starts at 1)
     start = max(start, 1)
 
+    from copy import copy
+    options = copy(options)  # so that options can be shared by threads
     options.line_range = [start, end]
     from autopep8 import fix_code
-    fixed = fix_code(source_code, options)
+    from pep8radius.profiling import stage
+    with stage('autopep8'):
+        fixed = fix_code(source_code, options)
 
-    try:
-        if options.docformatter:
-            from docformatter import format_code
-            fixed = format_code(
-                fixed,
+    return docformatter_line_range(fixed, start, end, options)
+
+
+def docformatter_line_range(source_code, start, end, options):
+    """Apply docformatter between the lines start and end of source, if the
+    docformatter option is set."""
+    return docformatter_line_ranges(source_code, [(start, end)], options)
+
+
+def docformatter_line_ranges(source_code, line_ranges, options):
+    """Apply docformatter to the docstrings on the line_ranges of source, if
+    the docformatter option is set.
+
+    The docstrings are found with a single tokenize pass, and docformatter
+    is only run over those on the line_ranges.
+
+    """
+    if not getattr(options, 'docformatter', False):
+        return source_code
+    from pep8radius.docstrings import format_docstrings
+    from pep8radius.profiling import stage
+
+    with stage('docformatter'):
+        try:
+            return format_docstrings(
+                source_code, line_ranges,
                 summary_wrap_length=options.max_line_length - 1,
                 description_wrap_length=(options.max_line_length
                                          - 2 * options.indent_size),
                 pre_summary_newline=options.pre_summary_newline,
                 post_description_blank=options.post_description_blank,
-                force_wrap=options.force_wrap,
-                line_range=[start, end])
-    except AttributeError:  # e.g. using autopep8.parse_args, pragma: no cover
-        pass
-
-    return fixed
+                force_wrap=options.force_wrap)
+        except AttributeError:  # e.g. autopep8.parse_args, pragma: no cover
+            return source_code
 
 
 def _maybe_print(something_to_print, end=None, min_=1, max_=99, verbose=0):
@@ -0,0 +1,71 @@
+"""This module defines LineRanges, the (start, end) line ranges of a file
+which have been modified (and are to be fixed)."""
+
+from bisect import bisect_left, bisect_right
+
+
+class LineRanges(list):
+
+    """A sorted list of disjoint (start, end) tuples of line numbers (both
+    inclusive, indexing from 1).
+
+    Overlapping and adjacent ranges are merged, as are ranges with at most
+    gap lines between them. Since this is a list of tuples it compares equal
+    to (and has the same repr as) the list of tuples. It shouldn't be
+    modified in place.
+
+    Example
+    -------
+    >>> LineRanges([(5, 6), (1, 2), (3, 3), (10, 12)])
+    [(1, 3), (5, 6), (10, 12)]
+    >>> LineRanges([(1, 3), (5, 6), (10, 12)], gap=1)
+    [(1, 6), (10, 12)]
+    >>> 4 in LineRanges([(1, 3), (5, 6)])
+    False
+
+    """
+
+    def __init__(self, ranges=(), gap=0):
+        merged = []
+        for start, end in sorted((max(s, 1), e) for s, e in ranges):
+            if end < start:
+                continue
+            if merged and start <= merged[-1][1] + 1 + gap:
+                if end > merged[-1][1]:
+                    merged[-1] = (merged[-1][0], end)
+            else:
+                merged.append((start, end))
+        super(LineRanges, self).__init__(merged)
+        self._starts = [s for s, _ in merged]
+
+    def __contains__(self, line):
+        """Whether the line number is in one of the ranges."""
+        i = bisect_right(self._starts, line) - 1
+        return i >= 0 and line <= self[i][1]
+
+    def intersects(self, start, end):
+        """Whether any of the lines start to end are in one of the
+        ranges."""
+        i = bisect_right(self._starts, end) - 1
+        return i >= 0 and start <= self[i][1]
+
+    def intersection(self, other):
+        """The LineRanges of the lines in both self and other."""
+        other = other if isinstance(other, LineRanges) else LineRanges(other)
+        result = []
+        for start, end in self:
+            i = max(bisect_left(other._starts, start) - 1, 0)
+            for s, e in other[i:]:
+                if s > end:
+                    break
+                if e >= start:
+                    result.append((max(s, start), min(e, end)))
+        return LineRanges(result)
+
+    def merged(self, gap):
+        """A copy of this with ranges at most gap lines apart merged."""
+        return LineRanges(self, gap=gap)
+
+    def __reduce__(self):
+        # Pickle (e.g. to send to the process pool) as a list of tuples.
+        return LineRanges, (list(self),)
@@ -55,7 +55,10 @@ def shell_out(cmd, stderr=STDOUT, cwd=None):
         from os import getcwd
         cwd = getcwd()  # TODO do I need to normalize this on Windows
 
-    out = check_output(cmd, cwd=cwd, stderr=stderr, universal_newlines=True)
+    from pep8radius.profiling import stage
+    with stage('vcs'):
+        out = check_output(cmd, cwd=cwd, stderr=stderr,
+                           universal_newlines=True)
     return _clean_output(out)
 
 
@@ -67,6 +70,30 @@ def shell_out_ignore_exitcode(cmd, stderr=STDOUT, cwd=None):
         return _clean_output(c.output)
 
 
+def shell_out_lines(cmd, cwd=None):
+    """Yield the lines of the output of cmd as it's written (rather than
+    waiting for and keeping all of it), ignoring its exit code and
+    stderr."""
+    import os
+    from subprocess import Popen, PIPE
+    from pep8radius.profiling import stage
+
+    with stage('vcs'):
+        with open(os.devnull, 'w') as devnull:
+            p = Popen(cmd, cwd=cwd, stdout=PIPE, stderr=devnull,
+                      universal_newlines=True)
+            try:
+                for line in iter(p.stdout.readline, ''):
+                    try:
+                        line = line.decode('utf-8')
+                    except AttributeError:  # python3, pragma: no cover
+                        pass
+                    yield line
+            finally:
+                p.stdout.close()
+                p.wait()
+
+
 def _clean_output(out):
     try:
         out = out.decode('utf-8')
@@ -75,6 +102,17 @@ def _clean_output(out):
     return out.strip()
 
 
+def exit_on_broken_pipe():
+    """Exit (rather than raise) when writing to a closed pipe, e.g. if
+    piping the output to head."""
+    import signal
+    try:  # pragma: no cover
+        signal.signal(signal.SIGPIPE, signal.SIG_DFL)
+    except AttributeError:  # pragma: no cover
+        # SIGPIPE is not available on Windows.
+        pass
+
+
 @contextmanager
 def from_dir(cwd):
     "Context manager to ensure in the cwd directory."
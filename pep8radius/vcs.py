@@ -10,7 +10,9 @@ abstract class VersionControl are specific to vcs e.g. Git.
 import os
 import re
 
+from pep8radius.ranges import LineRanges
 from pep8radius.shell import (shell_out, shell_out_ignore_exitcode,
+                              shell_out_lines,
                               CalledProcessError)  # with 2.6 compat
 
 
@@ -21,7 +23,7 @@ class AbstractMethodError(NotImplementedError):
 def using_git(cwd):
     """Test whether the directory cwd is contained in a git repository."""
     try:
-        git_log = shell_out(["git", "log"], cwd=cwd)
+        git_dir = shell_out(["git", "rev-parse", "--git-dir"], cwd=cwd)
         return True
     except (CalledProcessError, OSError):  # pragma: no cover
         return False
@@ -31,7 +33,7 @@ def using_hg(cwd):
     """Test whether the directory cwd is contained in a mercurial
     repository."""
     try:
-        hg_log = shell_out(["hg",   "log"], cwd=cwd)
+        hg_root = shell_out(["hg", "root"], cwd=cwd)
         return True
     except (CalledProcessError, OSError):
         return False
@@ -40,23 +42,79 @@ def using_hg(cwd):
 def using_bzr(cwd):
     """Test whether the directory cwd is contained in a bazaar repository."""
     try:
-        bzr_log = shell_out(["bzr", "log"], cwd=cwd)
+        bzr_root = shell_out(["bzr", "root"], cwd=cwd)
         return True
     except (CalledProcessError, OSError):
         return False
 
 
+# The directory (or file) marking the root of a repository, for each vcs.
+VC_MARKERS = (('git', '.git'), ('hg', '.hg'), ('bzr', '.bzr'))
+
+# Results of probing (with the using_ functions) for directories where
+# looking at the markers was ambiguous.
+_WHICH_CACHE = {}
+
+# The root directory of each (vcs, directory), see cached_root_dir.
+_ROOT_CACHE = {}
+
+
+def _is_marker(vc, path):
+    """Whether path is a marker (see VC_MARKERS) for the vc repository."""
+    if os.path.isdir(path):
+        return True
+    if vc == 'git' and os.path.isfile(path):
+        # a "gitfile" e.g. in a worktree or submodule
+        try:
+            with open(path) as f:
+                return f.read(8) == 'gitdir: '
+        except IOError:  # pragma: no cover
+            return False
+    return False
+
+
+def vc_markers(cwd):
+    """Find the closest directory containing cwd which has vcs markers.
+
+    Returns a tuple of this directory and a list of the vcs whose markers it
+    contains, or (None, []) if there are none.
+
+    """
+    directory = os.path.abspath(cwd)
+    while True:
+        found = [vc for vc, marker in VC_MARKERS
+                 if _is_marker(vc, os.path.join(directory, marker))]
+        if found:
+            return directory, found
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            return None, []
+        directory = parent
+
+
 class VersionControl(object):
 
     """Abstract base class for defining the methods we need to work with a
     version control system."""
 
+    # prefix of the new file names in the output of diff_cmd, e.g. 'b/'
+    diff_prefix = ''
+
     def __init__(self, cwd=None):
-        self.root = os.path.abspath(self.root_dir(cwd=cwd))
+        self.root = self.cached_root_dir(cwd=cwd)
 
     def _shell_out(self, *args, **kwargs):
         return shell_out(*args, cwd=self.root, **kwargs)
 
+    def close(self):
+        """Release any processes kept open (e.g. by GitBatch)."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
     @staticmethod
     def from_string(vc):
         """Return the VersionControl superclass from a string, for example
@@ -64,12 +122,27 @@ class VersionControl(object):
         try:
             # Note: this means all version controls must have
             # a title naming convention (!)
-            vc = globals()[vc.title()]
+            vc = globals()[vc.title().replace('-', '')]
             assert(issubclass(vc, VersionControl))
             return vc
         except (KeyError, AssertionError):
             raise NotImplementedError("Unknown version control system.")
 
+    @classmethod
+    def cached_root_dir(cls, cwd=None):
+        """Same as root_dir (as an absolute path), but remembers the root of
+        each directory, so that version control isn't called again (e.g. by
+        the daemon) while the closest vcs markers are still in the root."""
+        cwd = os.path.abspath(cwd or os.getcwd())
+        key = (cls, cwd)
+        root = _ROOT_CACHE.get(key)
+        marked = vc_markers(cwd)[0]
+        if root is None or root != marked:
+            root = os.path.abspath(cls.root_dir(cwd=cwd))
+            if root == marked:
+                _ROOT_CACHE[key] = root
+        return root
+
     @staticmethod
     def which(cwd=None):  # pragma: no cover
         """Try to find which version control system contains the cwd directory.
@@ -77,12 +150,32 @@ class VersionControl(object):
         Returns the VersionControl superclass e.g. Git, if none were
         found this will raise a NotImplementedError.
 
+        Note: this only calls out to the version control systems if it's not
+        clear from the closest vcs markers (e.g. .git) which to use.
+
         """
         if cwd is None:
             cwd = os.getcwd()
-        for (k, using_vc) in globals().items():
-            if k.startswith('using_') and using_vc(cwd=cwd):
-                return VersionControl.from_string(k[6:])
+
+        # Look for the vcs markers (e.g. a .git directory) in cwd or the
+        # directories above it, this doesn't require calling out to the vcs.
+        directory, found = vc_markers(cwd)
+        if len(found) == 1:
+            return VersionControl.from_string(found[0])
+
+        # Either there are markers for more than one vcs, or none at all (we
+        # may still be in a repository, e.g. if GIT_DIR is set), so we ask
+        # each of the vcs and remember the answer.
+        candidates = found or [vc for vc, _ in VC_MARKERS]
+        key = (directory or os.path.abspath(cwd), tuple(candidates))
+        try:
+            return _WHICH_CACHE[key]
+        except KeyError:
+            pass
+        for vc in candidates:
+            if globals()['using_' + vc](cwd=cwd):
+                _WHICH_CACHE[key] = VersionControl.from_string(vc)
+                return _WHICH_CACHE[key]
 
         # Not supported (yet)
         raise NotImplementedError("Unknown version control system, "
@@ -97,10 +190,18 @@ class VersionControl(object):
     def filenames_diff_cmd(r):  # pragma: no cover
         raise AbstractMethodError()
 
+    @staticmethod
+    def diff_cmd(r):  # pragma: no cover
+        raise AbstractMethodError()
+
     @staticmethod
     def parse_diff_filenames(diff_files):  # pragma: no cover
         raise AbstractMethodError()
 
+    @staticmethod
+    def tracked_files_cmd(r):  # pragma: no cover
+        raise AbstractMethodError()
+
     @staticmethod
     def root_dir(cwd=None):  # pragma: no cover
         raise AbstractMethodError()
@@ -123,7 +224,30 @@ class VersionControl(object):
         """Returns the line numbers of a file which have been changed."""
         cmd = self.file_diff_cmd(r, file_name)
         diff = shell_out_ignore_exitcode(cmd, cwd=self.root)
-        return list(self.modified_lines_from_diff(diff))
+        return LineRanges(self.modified_lines_from_diff(diff))
+
+    def get_modified_lines(self, r, file_names=None):
+        """Returns a dict of file_name (relative to the root directory) to the
+        line numbers which have been changed, for all the files in the diff
+        (or only those in file_names). Deleted files have no line numbers.
+
+        This uses a single call to version control, rather than one per file
+        (for file_names, one per 256 files).
+
+        """
+        from pep8radius.diff import iter_udiff
+        if file_names is None:
+            cmds = [self.diff_cmd(r)]
+        else:
+            cmds = [self.diff_cmd(r) + ['--'] + file_names[i:i + 256]
+                    for i in range(0, len(file_names), 256)]
+        lines = {}
+        for cmd in cmds:
+            # The diff is parsed as it's output (rather than kept in memory).
+            diff = shell_out_lines(cmd, cwd=self.root)
+            lines.update(iter_udiff(diff, prefix=self.diff_prefix,
+                                    deleted=True))
+        return lines
 
     def modified_lines_from_diff(self, diff):
         """Returns the changed lines in a diff.
@@ -146,6 +270,13 @@ class VersionControl(object):
 
         return set(f for f in diff_files if f.endswith('.py'))
 
+    def get_tracked_files(self, r):
+        """Get the py files which are tracked (relative to the root
+        directory)."""
+        cmd = self.tracked_files_cmd(r)
+        files = shell_out(cmd, cwd=self.root).splitlines()
+        return set(f for f in files if f.endswith('.py'))
+
 
 class Git(VersionControl):
 
@@ -170,14 +301,146 @@ class Git(VersionControl):
         """Get the names of the py files in diff."""
         return ['git', 'diff', r.rev, '--name-only']
 
+    @staticmethod
+    def diff_cmd(r):
+        """Get the diff for all files."""
+        return ['git', 'diff', r.rev, '--no-prefix']
+
+    @staticmethod
+    def tracked_files_cmd(r):
+        """Get the names of the tracked files."""
+        return ['git', 'ls-files']
+
     @staticmethod
     def parse_diff_filenames(diff_files):
         """Parse the output of filenames_diff_cmd."""
         return diff_files.splitlines()
 
 
+class GitBatch(Git):
+
+    """Git, but rather than calling git diff for the modified lines this
+    reads the files at the revision through a single git cat-file --batch
+    process (kept open until close is called, e.g. at the end of a with
+    block, or when Radius.fix finishes), and diffs them against the working
+    tree in-process. Files which git converts when checking them out (with
+    core.autocrlf, or the text, eol or filter attributes) can't be compared
+    with their blobs, so are diffed with git diff instead.
+
+    Use with vc='git-batch' (or the --git-batch option).
+
+    """
+
+    _cat_file = None
+    _autocrlf = None
+
+    def __init__(self, cwd=None):
+        from threading import Lock
+        super(GitBatch, self).__init__(cwd=cwd)
+        # The cat-file process is shared by every thread using this.
+        self._lock = Lock()
+
+    def get_modified_lines(self, r, file_names=None):
+        """Returns a dict of file_name (relative to the root directory) to the
+        line numbers which have been changed, for the files in
+        r.filenames_diff (or file_names)."""
+        if file_names is None:
+            file_names = [os.path.relpath(f, self.root)
+                          for f in r.filenames_diff]
+        filtered = self._filtered(file_names)
+        lines = {}
+        if filtered:
+            lines.update(super(GitBatch, self).get_modified_lines(
+                r, [f for f in file_names if f in filtered]))
+        for file_name in file_names:
+            if file_name in filtered:
+                continue
+            try:
+                lines[file_name] = self._diff_lines(r.rev, file_name)
+            except IOError:  # e.g. a deleted file
+                lines[file_name] = LineRanges()
+        return lines
+
+    def modified_lines(self, r, file_name):
+        """Returns the line numbers of a file which have been changed."""
+        file_name = os.path.relpath(os.path.join(self.root, file_name),
+                                    self.root)
+        if self._filtered([file_name]):
+            return super(GitBatch, self).modified_lines(r, file_name)
+        try:
+            return self._diff_lines(r.rev, file_name)
+        except IOError:
+            return LineRanges()
+
+    def _filtered(self, file_names):
+        """Return the set of file_names (relative to the root directory)
+        which git converts when checking them out."""
+        if not file_names:
+            return set()
+        if self._autocrlf is None:
+            self._autocrlf = shell_out_ignore_exitcode(
+                ['git', 'config', '--get', 'core.autocrlf'],
+                cwd=self.root).lower()
+        if self._autocrlf in ('true', 'yes', 'on', '1', 'input'):
+            return set(file_names)
+
+        filtered = set()
+        for i in range(0, len(file_names), 256):
+            out = self._shell_out(['git', 'check-attr', '-z', 'text', 'eol',
+                                   'filter', '--'] + file_names[i:i + 256])
+            # NUL separated triples of path, attribute and value.
+            fields = out.split('\0')
+            for name, value in zip(fields[::3], fields[2::3]):
+                if value != 'unspecified':
+                    filtered.add(os.path.normpath(name))
+        return filtered
+
+    def _diff_lines(self, rev, file_name):
+        from pep8radius.diff import modified_lines_from_sources
+        with open(os.path.join(self.root, file_name), 'rb') as f:
+            modified = f.read().decode('utf-8', 'replace')
+        return modified_lines_from_sources(self.file_at(rev, file_name),
+                                           modified)
+
+    def file_at(self, rev, file_name):
+        """Return the contents of file_name (relative to the root directory)
+        at rev, or the empty string if it's not in rev (e.g. a new file)."""
+        from pep8radius.profiling import stage
+        name = '%s:%s' % (rev, file_name.replace(os.sep, '/'))
+        with self._lock:
+            with stage('vcs'):
+                if self._cat_file is None:
+                    from subprocess import PIPE, Popen
+                    self._cat_file = Popen(['git', 'cat-file', '--batch'],
+                                           cwd=self.root, stdin=PIPE,
+                                           stdout=PIPE)
+                self._cat_file.stdin.write(name.encode('utf-8') + b'\n')
+                self._cat_file.stdin.flush()
+                header = self._cat_file.stdout.readline().split()
+                if len(header) != 3:  # "<name> missing"
+                    return ''
+                contents = self._cat_file.stdout.read(int(header[2]))
+                self._cat_file.stdout.read(1)  # the trailing newline
+        return contents.decode('utf-8', 'replace')
+
+    def close(self):
+        """Stop the git cat-file process."""
+        with self._lock:
+            if self._cat_file is not None:
+                self._cat_file.stdin.close()
+                self._cat_file.wait()
+                self._cat_file.stdout.close()
+                self._cat_file = None
+
+    def __del__(self):
+        if hasattr(self, '_lock'):  # i.e. __init__ didn't raise
+            self.close()
+
+
 class Hg(VersionControl):
 
+    diff_prefix = 'b/'
+
     def current_branch(self):
         return self._shell_out(["hg", "id"])[:12]  # this feels awkward
 
@@ -199,6 +462,16 @@ class Hg(VersionControl):
         """Get the names of the py files in diff."""
         return ["hg", "diff", "--stat", "-r", r.rev]
 
+    @staticmethod
+    def diff_cmd(r):
+        """Get the diff for all files."""
+        return ['hg', 'diff', '-r', r.rev]
+
+    @staticmethod
+    def tracked_files_cmd(r):
+        """Get the names of the tracked files."""
+        return ['hg', 'manifest']
+
     @staticmethod
     def parse_diff_filenames(diff_files):
         """Parse the output of filenames_diff_cmd."""
@@ -242,6 +515,16 @@ class Bzr(VersionControl):
         # TODO Can we do this better (without parsing the entire diff?)
         return ['bzr', 'status', '-S', '-r', r.rev]  # TODO '--from-root' ?
 
+    @staticmethod
+    def diff_cmd(r):
+        """Get the diff for all files."""
+        return ['bzr', 'diff', '-r', r.rev]
+
+    @staticmethod
+    def tracked_files_cmd(r):
+        """Get the names of the tracked files."""
+        return ['bzr', 'ls', '--recursive', '--versioned', '--kind=file']
+
     @staticmethod
     def parse_diff_filenames(diff_files):
         """Parse the output of filenames_diff_cmd."""
@@ -0,0 +1,106 @@
+"""This module defines Watcher, which refixes files as they're saved (with
+pep8radius --watch).
+
+The Radius (the root directory, branch point and options) is kept, and the
+tracked py files are listed once (from version control). These are polled
+for changes every interval seconds, and once a burst of saves has stopped
+(a poll finds no further changes) only the changed files have their
+modified lines found and fixed.
+
+Note: files added to the repository after the watch started are not
+watched.
+
+"""
+
+import os
+
+
+class Watcher(object):
+
+    """Watch the tracked files of the Radius r, refixing them as they
+    change."""
+
+    def __init__(self, r, interval=0.5):
+        self.r = r
+        self.interval = interval
+        tracked = r._clean_filenames(r.vc.get_tracked_files(r))
+        self.files = sorted(set(tracked) | set(r.filenames_diff))
+        self._stats = self._stat(self.files)
+
+    @staticmethod
+    def _stat(file_names):
+        """Return a dict of file_name to its (mtime, size), or None if it
+        doesn't exist."""
+        stats = {}
+        for file_name in file_names:
+            try:
+                st = os.stat(file_name)
+                stats[file_name] = (st.st_mtime, st.st_size)
+            except OSError:
+                stats[file_name] = None
+        return stats
+
+    def poll(self):
+        """Return the files which have changed since the last poll."""
+        stats = self._stat(self.files)
+        changed = [f for f in self.files if stats[f] != self._stats[f]]
+        self._stats = stats
+        return changed
+
+    def wait(self, sleep=None):
+        """Block until files have changed, and then until they've stopped
+        changing (for interval seconds), returns the changed files."""
+        if sleep is None:
+            from time import sleep
+        changed = set()
+        while True:
+            sleep(self.interval)
+            new = self.poll()
+            if new:
+                changed.update(new)
+            elif changed:
+                return sorted(changed)
+
+    def refix(self, file_names):
+        """Find the modified lines of each of file_names (with one call to
+        version control) and fix them, yielding a FixResult for each of
+        those which are modified."""
+        from pep8radius.radius import fix_file_result
+        r = self.r
+
+        relpaths = [os.path.relpath(f, r.root) for f in file_names]
+        modified_lines = r.vc.get_modified_lines(r, relpaths)
+        if r._modified_lines is None:
+            r._modified_lines = {}
+        for relpath in relpaths:
+            r._modified_lines.pop(relpath, None)
+        r._modified_lines.update(modified_lines)
+
+        modified = [f for f, relpath in zip(file_names, relpaths)
+                    if relpath in modified_lines and os.path.exists(f)]
+        r.filenames_diff = sorted(
+            set(r.filenames_diff).difference(file_names).union(modified))
+
+        for file_name in modified:
+            result = fix_file_result(file_name, r.modified_lines(file_name),
+                                     r.options, in_place=r.in_place,
+                                     verbose=r.verbose, cwd=r.cwd,
+                                     cache=r.cache)
+            # Our own write (with in_place) isn't a change.
+            self._stats.update(self._stat([file_name]))
+            yield result
+        r.close()
+
+    def run(self):
+        """Fix the modified files, then refix them as they change (until
+        interrupted), returns the exit status."""
+        r = self.r
+        r.fix()
+        # The fixes just written (with in_place) aren't changes.
+        self._stats = self._stat(self.files)
+        try:
+            while True:
+                changed = self.wait()
+                r._print_results(self.refix(changed), len(changed))
+        except KeyboardInterrupt:
+            return 0
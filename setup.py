@@ -71,5 +71,7 @@ setup(
     test_suite='tests',
     zip_safe=False,
     entry_points={'console_scripts': ['btyfi = pep8radius.main:_main',
-                                      'pep8radius = pep8radius.main:_main']},
+                                      'pep8radius = pep8radius.main:_main',
+                                      'pep8radius-client = '
+                                      'pep8radius.daemon:client_main']},
 )
@@ -0,0 +1,3 @@
+b = 1
+b = 2
+b = 3
@@ -0,0 +1,2 @@
+c=1
+c=2
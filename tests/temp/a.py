@@ -0,0 +1 @@
+a=1;
\ No newline at end of file
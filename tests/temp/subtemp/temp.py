@@ -0,0 +1,13 @@
+def poor_indenting():
+  a = 1
+  b = 2
+  return a + b
+
+foo = 1; bar = 2; print(foo * bar)
+a = 1
+b = 42
+c = 3
+d=7
+
+def f(x = 1, y = 2):
+    return x + y
@@ -0,0 +1,1000 @@
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
+a = 0
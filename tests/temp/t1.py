@@ -0,0 +1,2000 @@
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
+a = 1
@@ -0,0 +1,3000 @@
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
+a = 2
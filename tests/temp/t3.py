@@ -0,0 +1,4000 @@
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
+a = 3
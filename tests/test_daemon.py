@@ -0,0 +1,113 @@
+import socket
+import threading
+
+from pep8radius.daemon import (handle, run_in_daemon, _in_process,
+                               _is_private, default_socket)
+from tests.util import *
+
+
+SOCKET = os.path.join(TEMP_DIR, 'daemon.sock')
+
+
+class TestDaemon(TestCase):
+
+    def setUp(self):
+        if not hasattr(socket, 'AF_UNIX'):
+            raise SkipTest("unix sockets not available")
+        mk_temp_dirs()
+        remove(SOCKET)
+        self.server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.server.bind(SOCKET)
+        self.server.listen(1)
+
+    def tearDown(self):
+        self.server.close()
+        remove(SOCKET)
+
+    def handle_one(self):
+        def accept_and_handle():
+            conn, _ = self.server.accept()
+            try:
+                handle(conn)
+            finally:
+                conn.close()
+        thread = threading.Thread(target=accept_and_handle)
+        thread.daemon = True
+        thread.start()
+        return thread
+
+    def test_version(self):
+        thread = self.handle_one()
+        out, err = StringIO(), StringIO()
+        status = run_in_daemon(['--version'], cwd=TEMP_DIR, stdout=out,
+                               stderr=err, socket_path=SOCKET)
+        thread.join()
+        self.assertEqual(status, 0)
+        self.assertEqual(out.getvalue().strip(), version)
+
+    def test_bad_args(self):
+        thread = self.handle_one()
+        out, err = StringIO(), StringIO()
+        status = run_in_daemon(['--max-line-length=foo'], cwd=TEMP_DIR,
+                               stdout=out, stderr=err, socket_path=SOCKET)
+        thread.join()
+        self.assertEqual(status, 2)
+        self.assertIn('invalid int value', err.getvalue())
+
+    def test_watch(self):
+        self.assertTrue(_in_process(['--in-place', '--watch']))
+        self.assertFalse(_in_process(['--watch-interval=1', '--in-place']))
+        # The args are parsed as main parses them, e.g. abbreviations.
+        self.assertTrue(_in_process(['--dae']))
+        self.assertTrue(_in_process(['--from', '-']))
+        self.assertFalse(_in_process(['--version']))
+        with captured_output() as (out, err):
+            self.assertFalse(_in_process(['--not-an-option']))
+            self.assertFalse(_in_process(['-h']))
+        self.assertEqual((out.getvalue(), err.getvalue()), ('', ''))
+        # The daemon refuses to watch, rather than blocking other clients.
+        thread = self.handle_one()
+        out, err = StringIO(), StringIO()
+        status = run_in_daemon(['--watch'], cwd=TEMP_DIR, stdout=out,
+                               stderr=err, socket_path=SOCKET)
+        thread.join()
+        self.assertEqual(status, 2)
+        self.assertIn('--watch', err.getvalue())
+
+    def test_private_socket(self):
+        self.assertTrue(_is_private(SOCKET))
+        shared = os.path.join(TEMP_DIR, 'shared')
+        os.mkdir(shared)
+        try:
+            os.chmod(shared, 0o777)
+            path = os.path.join(shared, 'daemon.sock')
+            self.assertFalse(_is_private(path))
+            self.assertEqual(run_in_daemon(['--version'],
+                                           socket_path=path), None)
+        finally:
+            remove_dir(shared)
+
+        environ = dict(os.environ)
+        try:
+            os.environ.pop('PEP8RADIUS_SOCKET', None)
+            os.environ['XDG_RUNTIME_DIR'] = TEMP_DIR
+            self.assertEqual(default_socket(),
+                             os.path.join(TEMP_DIR, 'pep8radius.sock'))
+            del os.environ['XDG_RUNTIME_DIR']
+            path = default_socket()
+            self.assertTrue(_is_private(path))
+            self.assertEqual(os.stat(os.path.dirname(path)).st_mode & 0o777,
+                             0o700)
+        finally:
+            os.environ.clear()
+            os.environ.update(environ)
+
+    def test_no_daemon(self):
+        self.server.close()
+        remove(SOCKET)
+        status = run_in_daemon(['--version'], socket_path=SOCKET)
+        self.assertEqual(status, None)
+
+
+if __name__ == '__main__':
+    test_main()
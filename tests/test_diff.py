@@ -9,6 +9,122 @@ class TestUDiffParsing(TestCase):
         lines = list(modified_lines_from_udiff(example_udiff))
         assert(lines == [(54, 56), (424, 429), (444, 444)])
 
+    def test_iter_udiff(self):
+        with open(os.path.join(TEST_DIR, 'diff1.txt')) as f:
+            example_udiff = f.read()
+        other = get_diff('a=1\nb=2\n', 'a=1\nb = 2\n', 'foo/bar.py',
+                         'a', 'b')
+        with open(os.path.join(TEST_DIR, 'diff1.txt')) as f:
+            files = dict(iter_udiff(f, prefix='b/'))
+        files.update(iter_udiff(other.splitlines(), prefix='b/'))
+        self.assertEqual(files,
+                         {os.path.join('foo', 'bar.py'): [(2, 2)],
+                          os.path.join('pep8radius', '__init__.py'):
+                          [(54, 56), (424, 429), (444, 444)]})
+
+    def test_iter_udiff_headers(self):
+        udiff = """diff --git a/zero.py b/zero.py
+index 1..2 100644
+--- a/zero.py
++++ b/zero.py
+@@ -3 +3 @@ def f():
+-    return 1
++    return 2
+@@ -10,0 +11,2 @@
++x = 1
++y = 2
+diff --git a/new.py b/new.py
+new file mode 100644
+--- /dev/null
++++ b/new.py
+@@ -0,0 +1 @@
++a = 1
+diff --git a/gone.py b/gone.py
+deleted file mode 100644
+--- a/gone.py
++++ /dev/null
+@@ -1,2 +0,0 @@
+--- a comment which looks like a header
+-a = 1
+diff --git a/old.py b/moved.py
+similarity index 100%
+rename from old.py
+rename to moved.py
+diff --git a/image.png b/image.png
+Binary files a/image.png and b/image.png differ
+diff --git a/old2.py b/moved2.py
+similarity index 90%
+rename from old2.py
+rename to moved2.py
+--- a/old2.py
++++ b/moved2.py
+@@ -1,3 +1,3 @@
+ a = 1
+-b = 2
++b = 3
+ c = 4
+"""
+        self.assertEqual(list(iter_udiff(udiff.splitlines(True))),
+                         [('zero.py', [(3, 3), (11, 12)]),
+                          ('new.py', [(1, 1)]),
+                          ('moved2.py', [(2, 2)])])
+        self.assertEqual(list(iter_udiff(udiff.splitlines(True),
+                                         deleted=True)),
+                         [('zero.py', [(3, 3), (11, 12)]),
+                          ('new.py', [(1, 1)]),
+                          ('gone.py', []),
+                          ('moved2.py', [(2, 2)])])
+        self.assertEqual(list(iter_udiff(udiff.splitlines(True), prefix='b/',
+                                         deleted=True))[2], ('gone.py', []))
+        self.assertEqual(list(iter_udiff(udiff.replace('a/', '')
+                                              .replace('b/', '')
+                                              .splitlines(True),
+                                         prefix='', deleted=True))[2],
+                         ('gone.py', []))
+
+    def test_get_diff_same_as_difflib(self):
+        from difflib import unified_diff
+        original = ''.join('x = %s\n' % i if i % 10 else '\n'
+                           for i in range(3000))
+        lines = original.splitlines(True)
+        lines[300:300] = ['\n', '\n']
+        lines[1000] = lines[1000].upper()
+        del lines[2000:2003]
+        fixed = ''.join(lines)
+        expected = ''.join(unified_diff(original.splitlines(True), lines,
+                                        'original/f.py', 'fixed/f.py'))
+        self.assertEqual(get_diff(original, fixed, 'f.py'), expected)
+        self.assertEqual(get_diff(original, original, 'f.py'), '')
+
+    def test_udiff_stats(self):
+        from pep8radius.diff import udiff_stats
+        original = 'a=1\nb=2\nc=3\ndef f():\n    pass\n'
+        fixed = 'a = 1\nb=2\nc = 3\n\n\ndef f():\n    pass\n'
+        self.assertEqual(udiff_stats(get_diff(original, fixed, 'f.py')),
+                         (4, 2, [(1, 1), (3, 3)]))
+        self.assertEqual(udiff_stats(get_diff('', 'a = 1\n', 'f.py')),
+                         (1, 0, [(1, 1)]))
+        self.assertEqual(udiff_stats(''), (0, 0, []))
+
+    def test_print_diff(self):
+        import colorama
+        diff = get_diff('a=1  \nb=2\n', 'a = 1\nb=2\nc = 3', 'f.py')
+        out = StringIO()
+        print_diff(diff, color=False, file=out)
+        self.assertEqual(out.getvalue(), diff)
+        self.assertTrue(colorama.Fore.RED)  # colorama isn't changed
+
+        out = StringIO()
+        out.isatty = lambda: True
+        print_diff(diff.splitlines(True), file=out)
+        self.assertIn(colorama.Fore.RED + '-a=1' + colorama.Style.RESET_ALL +
+                      colorama.Back.RED + '  ', out.getvalue())
+        self.assertIn(colorama.Fore.GREEN + '+a = 1', out.getvalue())
+
+        out = StringIO()
+        print_diff(diff, file=out)  # not a terminal, so no color
+        self.assertEqual(out.getvalue(), diff)
+
 
 if __name__ == '__main__':
     test_main()
@@ -0,0 +1,37 @@
+from pep8radius.docstrings import docstring_index, format_docstrings
+from tests.util import *
+
+
+class TestDocstrings(TestCase):
+
+    code = ('"""   Module docstring"""\n\n\ndef f():\n'
+            '    """  f\'s docstring"""'
+            '\n    x = """not a docstring"""\n    if x:\n        """  Nor is'
+            ' this one, but docformatter formats it"""\n\n\nclass A:\n\n'
+            '    """   A\'s\n    docstring"""\n')
+
+    def test_docstring_index(self):
+        index = docstring_index(self.code)
+        self.assertEqual([(start[0], end[0], indent)
+                          for start, end, indent, _ in index],
+                         [(1, 1, ''), (5, 5, '    '), (8, 8, '        '),
+                          (13, 14, '    ')])
+        self.assertEqual(docstring_index('def f(:\n  """'), None)
+        self.assertEqual(len(docstring_index(self.code, until=5)), 2)
+
+    def test_format_docstrings(self):
+        from docformatter import format_code
+        for line_ranges in [[(1, 1)], [(2, 4)], [(5, 12)], [(1, 20)],
+                            [(1, 5), (15, 15)]]:
+            expected = self.code
+            for start, end in reversed(line_ranges):
+                expected = format_code(expected, line_range=[start, end])
+            self.assertEqual(format_docstrings(self.code, line_ranges),
+                             expected)
+        self.assertEqual(format_docstrings(self.code, [(2, 4)]), self.code)
+        self.assertEqual(format_docstrings(self.code, []), self.code)
+
+        # tokenize's rows only count '\n' (not e.g. form feeds)
+        code = 'x = 1\n\x0c\ndef f():\n    """  Doc.  """\n    return 1\n'
+        self.assertEqual(format_docstrings(code, [(4, 4)]),
+                         code.replace('"""  Doc.  """', '"""Doc."""'))
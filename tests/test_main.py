@@ -43,6 +43,17 @@ class TestMain(TestCase):
         version_ = pep8radius_main(['--version'])
         self.assertEqual(version_, version)
 
+    def test_lazy_imports(self):
+        # pep8radius shouldn't import the modules needed for fixing (or
+        # printing diffs) unless it needs to.
+        script = ('import sys; sys.path.insert(0, %r); import pep8radius; '
+                  'from pep8radius.main import main, parse_args; '
+                  'main(["--version"]); parse_args([]); '
+                  'print(sorted(m for m in ["autopep8", "colorama", "difflib",'
+                  ' "docformatter", "yapf"] if m in sys.modules))' % ROOT_DIR)
+        out = shell_out([sys.executable, '-c', script], cwd=ROOT_DIR)
+        self.assertEqual(out.splitlines()[-1], '[]')
+
     def test_list_fixes(self):
         fixes = pep8radius_main(['--list-fixes'])
         afixes = shell_out(['autopep8', '--list-fixes'])
@@ -85,6 +96,17 @@ class TestMain(TestCase):
                                 apply_config=True, root=TEMP_DIR)
         self.assertEqual(2, args_after.indent_size)
 
+    def test_config_cache(self):
+        with open(LOCAL_CONFIG, mode='w') as f:
+            f.write("[pep8]\nindent-size=2")
+        args = parse_args([''], apply_config=True, root=TEMP_DIR)
+        self.assertEqual(2, args.indent_size)
+        with open(LOCAL_CONFIG, mode='w') as f:
+            f.write("[pep8]\nindent-size=3")
+        os.utime(LOCAL_CONFIG, (0, 0))  # a different modification time
+        args = parse_args([''], apply_config=True, root=TEMP_DIR)
+        self.assertEqual(3, args.indent_size)
+
     def test_help(self):
         self.check_help()
 
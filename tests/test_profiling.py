@@ -0,0 +1,61 @@
+from pep8radius import profiling
+from tests.util import *
+
+
+class TestProfiling(TestCase):
+
+    def tearDown(self):
+        profiling.stop()
+
+    def test_not_profiling(self):
+        with profiling.stage('autopep8'):
+            pass
+        self.assertEqual(profiling.active(), None)
+
+    def test_stages(self):
+        profiler = profiling.start()
+        code = 'a=1\nb=2\n'
+        with profiling.profile_file('foo.py', [(1, 1)]):
+            fix_code(code, [(1, 1)])
+        get_diff(code, code, 'foo.py')
+        self.assertIs(profiling.stop(), profiler)
+        self.assertEqual(profiling.active(), None)
+
+        report = profiler.report()
+        self.assertEqual(report['stages']['autopep8']['calls'], 1)
+        self.assertEqual(len(report['files']), 1)
+        f = report['files'][0]
+        self.assertEqual((f['file'], f['ranges']), ('foo.py', 1))
+        self.assertEqual(list(f['stages']), ['autopep8'])
+
+        out = StringIO()
+        profiler.print_report(file=out)
+        self.assertIn('autopep8', out.getvalue())
+        self.assertIn('foo.py', out.getvalue())
+
+    def test_record_stages(self):
+        with profiling.record_stages() as stages:
+            fix_code('a=1\n', [(1, 1)])
+        self.assertEqual(list(stages), ['autopep8'])
+        with profiling.stage('io'):
+            pass
+        self.assertEqual(list(stages), ['autopep8'])
+
+    def test_stats(self):
+        mk_temp_dirs()
+        profiler = profiling.start(stats=1)
+        for f in ['foo.py', 'bar.py']:
+            with profiling.profile_file(f, []):
+                pass
+        profiling.stop()
+        paths = profiler.dump_stats(TEMP_DIR)
+        try:
+            self.assertEqual(len(paths), 1)
+            self.assertTrue(os.path.exists(paths[0]))
+        finally:
+            for path in paths:
+                remove(path)
+
+
+if __name__ == '__main__':
+    test_main()
@@ -142,6 +142,16 @@ class MixinTests:
             r.fix()
         self.assertEqual(out.getvalue(), '')
 
+    def test_deleted_file_modified_lines(self):
+        os.remove(os.path.join(TEMP_DIR, 'a.py'))
+        r = Radius(vc=self.vc, cwd=TEMP_DIR)
+
+        def modified_lines(r, file_name):
+            raise AssertionError("%s wasn't in the diff" % file_name)
+        r.vc.modified_lines = modified_lines
+        self.assertEqual(r.modified_lines(os.path.join(TEMP_DIR, 'a.py')),
+                         [])
+
     def test_exclude(self):
         self.save_and_commit('b=1;', 'BBB.py')
         save('b=1', 'BBB.py')
@@ -151,6 +161,192 @@ class MixinTests:
             r.fix()
         self.assertEqual(out.getvalue(), '')
 
+    def test_jobs(self):
+        self.save_and_commit('b=1;\nb=2\n', 'BBB.py')
+        self.save_and_commit('c=1;\nc=2\n', 'CCC.py')
+        save('b=1\nb=2\n', 'BBB.py')
+        save('c=1\nc=2\n', 'CCC.py')
+        args = parse_args(['--diff', '--no-color', '--jobs=2'])
+        r = Radius(options=args, vc=self.vc, cwd=TEMP_DIR)
+        with captured_output() as (out, err):
+            r.fix()
+
+        files = [os.path.join(TEMP_DIR, f) for f in ['BBB.py', 'CCC.py']]
+        exp_diff = get_diff_many(['b=1\nb=2\n', 'c=1\nc=2\n'],
+                                 ['b = 1\nb=2\n', 'c = 1\nc=2\n'],
+                                 files)
+        self.assert_equal(out.getvalue(), exp_diff, 'jobs')
+
+    def test_iter_fix(self):
+        self.save_and_commit('b=1;\nb=2\n', 'BBB.py')
+        save('b=1\nb=2\nb=3\n', 'BBB.py')
+        args = parse_args(['--no-color', '--diff'])
+        r = Radius(options=args, vc=self.vc, cwd=TEMP_DIR)
+        self.assertEqual((args.diff, r.options.diff), (True, False))
+        results = list(r.iter_fix())
+        self.assertEqual([res.file_name for res in results],
+                         r.filenames_diff)
+        result, = [res for res in results if res.file_name.endswith('BBB.py')]
+        self.assertEqual(result.line_ranges, [(1, 3)])
+        self.assertEqual(result.lines_changed, 3)
+        self.assertEqual(result.diff,
+                         get_diff('b=1\nb=2\nb=3\n', 'b = 1\nb = 2\nb = 3\n',
+                                  result.file_name))
+        self.assertTrue(result.time >= 0)
+
+    def test_fix_async(self):
+        if sys.version_info < (3, 5):
+            raise SkipTest("asyncio API requires python 3.5+")
+        import asyncio
+        from pep8radius import aio
+        self.save_and_commit('b=1;\nb=2\n', 'BBB.py')
+        save('b=1\nb=2\nb=3\n', 'BBB.py')
+        r = Radius(options=parse_args(['--no-color']), vc=self.vc,
+                   cwd=TEMP_DIR)
+        expected = list(r.iter_fix())
+
+        loop = asyncio.new_event_loop()
+        try:
+            r = loop.run_until_complete(
+                aio.radius(options=parse_args(['--no-color']), vc=self.vc,
+                           cwd=TEMP_DIR))
+            results = loop.run_until_complete(r.fix_async())
+
+            # The files missing from the diff are diffed without blocking
+            # (rather than by r.modified_lines).
+            r._modified_lines = {}
+            again = loop.run_until_complete(r.fix_async())
+        finally:
+            loop.close()
+        self.assertEqual([(res.file_name, res.line_ranges, res.diff)
+                          for res in results],
+                         [(res.file_name, res.line_ranges, res.diff)
+                          for res in expected])
+        self.assertTrue(any(res.diff for res in results))
+        self.assertEqual([res[:4] for res in again],
+                         [res[:4] for res in results])
+        self.assertEqual(sorted(r._modified_lines),
+                         [os.path.relpath(f, r.root)
+                          for f in r.filenames_diff])
+
+    def test_cache(self):
+        original = 'def f(x):\n    return 2*x\n'
+        modified = 'def f(x):\n    return 3*x\n'
+        expected = 'def f(x):\n    return 3 * x\n'
+        try:
+            self.check(original, modified, expected, 'test_cache',
+                       ['--cache'])
+            self.assertTrue(os.listdir(os.path.join(TEMP_DIR,
+                                                    '.pep8radius_cache')))
+        finally:
+            remove_dir(os.path.join(TEMP_DIR, '.pep8radius_cache'))
+
+    def test_incremental(self):
+        self.save_and_commit('b = 1\nb = 2\n', 'BBB.py')
+        save('b = 1\nb = 2\nb = 3\n', 'BBB.py')
+        args = parse_args(['--no-color', '--incremental'])
+        try:
+            r = Radius(options=args, vc=self.vc, cwd=TEMP_DIR)
+            result, = [res for res in r.iter_fix()
+                       if res.file_name.endswith('BBB.py')]
+            self.assertEqual(result.line_ranges, [(3, 3)])
+
+            # BBB.py was clean and hasn't changed, so is skipped.
+            r = Radius(options=args, vc=self.vc, cwd=TEMP_DIR)
+            result, = [res for res in r.iter_fix()
+                       if res.file_name.endswith('BBB.py')]
+            self.assertEqual(result.line_ranges, [])
+
+            save('b = 1\nb = 2\nb=3\n', 'BBB.py')
+            r = Radius(options=args, vc=self.vc, cwd=TEMP_DIR)
+            result, = [res for res in r.iter_fix()
+                       if res.file_name.endswith('BBB.py')]
+            self.assertEqual(result.line_ranges, [(3, 3)])
+            self.assertTrue(result.diff)
+        finally:
+            remove_dir(os.path.join(TEMP_DIR, '.pep8radius_cache'))
+
+    def test_batch(self):
+        from tempfile import mkdtemp
+        batch = mkdtemp()
+        other = os.path.join(batch, 'other')
+        try:
+            os.mkdir(other)
+            self.create_repo(cwd=other)
+            save('c = 1\n', 'c.py', cwd=other)
+            self.successfully_commit_files(['c.py'], cwd=other)
+            save('c = 1\nc=2\n', 'c.py', cwd=other)
+            save('a=2;', 'a.py')
+            save('# path [rev]\nother\n\nmissing\n', 'manifest.txt',
+                 cwd=batch)
+
+            out = pep8radius_main(['--diff', '--no-color', '--repo', '.',
+                                   '--manifest',
+                                   os.path.join(batch, 'manifest.txt')])
+            error, diff = out.split('\n', 1)
+            self.assertTrue(error.startswith(os.path.join(batch, 'missing')))
+            exp_diff = get_diff_many(['a=2;', 'c = 1\nc=2\n'],
+                                     ['a = 2\n', 'c = 1\nc = 2\n'],
+                                     [os.path.join(TEMP_DIR, 'a.py'),
+                                      os.path.join(other, 'c.py')])
+            self.assertEqual(diff, exp_diff.strip())
+        finally:
+            remove_dir(batch)
+
+    def test_format_jsonl(self):
+        import json
+        self.save_and_commit('b = 1\n', 'BBB.py')
+        save('b = 1\nb=2\n', 'BBB.py')
+        out = pep8radius_main(['--format', 'jsonl', '--diff',
+                               '--exclude=a.py'])
+        record, = [json.loads(line) for line in out.splitlines()]
+        self.assertEqual(record['file'], os.path.join(TEMP_DIR, 'BBB.py'))
+        self.assertEqual(record['ranges'], [[2, 2]])
+        self.assertEqual(record['fixed_ranges'], [[2, 2]])
+        self.assertEqual((record['added'], record['removed']), (1, 1))
+        self.assertIn('autopep8', record['stages'])
+        self.assertEqual(record['diff'],
+                         get_diff('b = 1\nb=2\n', 'b = 1\nb = 2\n',
+                                  record['file']))
+
+    def test_watch(self):
+        from pep8radius.watch import Watcher
+        self.save_and_commit('b = 1\n', 'BBB.py')
+        bbb = os.path.join(TEMP_DIR, 'BBB.py')
+        args = parse_args(['--no-color', '--in-place'])
+        r = Radius(options=args, vc=self.vc, cwd=TEMP_DIR)
+        w = Watcher(r, interval=0)
+        self.assertIn(bbb, w.files)
+        self.assertEqual(w.poll(), [])
+
+        save('b = 1\nb=2\n', 'BBB.py')
+        self.assertEqual(w.wait(), [bbb])
+        result, = w.refix([bbb])
+        self.assertEqual(result.line_ranges, [(2, 2)])
+        self.assertIn(bbb, r.filenames_diff)
+        with open(bbb) as f:
+            self.assertEqual(f.read(), 'b = 1\nb = 2\n')
+        # fixing BBB.py in place isn't a change
+        self.assertEqual(w.poll(), [])
+
+        # nor is the first fix, run before watching
+        save('b = 1\nb=2\nb=3\n', 'BBB.py')
+        w = Watcher(Radius(options=args, vc=self.vc, cwd=TEMP_DIR),
+                    interval=0)
+        w.wait = lambda: self.assertEqual(w.poll(), []) or 1 / 0
+        with captured_output():
+            self.assertRaises(ZeroDivisionError, w.run)
+        with open(bbb) as f:
+            self.assertEqual(f.read(), 'b = 1\nb = 2\nb = 3\n')
+
+    def test_cached_root_dir(self):
+        from pep8radius.vcs import _ROOT_CACHE
+        vc = VersionControl.from_string(self.vc)
+        root = vc.cached_root_dir(cwd=SUBTEMP_DIR)
+        self.assertEqual(root, os.path.abspath(vc.root_dir(cwd=SUBTEMP_DIR)))
+        self.assertEqual(_ROOT_CACHE[(vc, SUBTEMP_DIR)], root)
+        self.assertEqual(vc.cached_root_dir(cwd=SUBTEMP_DIR), root)
+
     def test_config(self):
         LOCAL_CONFIG = os.path.join(TEMP_DIR, '.pep8')
         with open(LOCAL_CONFIG, mode='w') as f:
@@ -180,5 +376,201 @@ class TestRadiusFromDiff(TestCase):
         exp_diff = get_diff(modified, expected, 'foo.py')
         self.assertEqual(out.getvalue(), exp_diff)
 
+
+class TestFixCode(TestCase):
+
+    def test_multiple_ranges(self):
+        code = ('def f( x ):\n  if  True:\n    return 2*x\n\na=1; b=2\nc=3\n'
+                '\n\n\ndef g( y ):\n    return y\n')
+        expected = ('def f(x):\n  if  True:\n    return 2 * x\n\na = 1\n'
+                    'b = 2\nc=3\n\n\ndef g(y):\n    return y\n')
+        line_ranges = [(1, 1), (3, 3), (5, 5), (10, 10)]
+        options = parse_args([''])
+        self.assertEqual(fix_code(code, line_ranges, options), expected)
+
+        # the same as fixing each line range separately
+        partial = code
+        for start, end in reversed(line_ranges):
+            partial = fix_line_range(partial, start, end, options)
+        self.assertEqual(partial, expected)
+
+    def test_fix_line_ranges(self):
+        from pep8radius.fixer import fix_line_ranges
+        code = 'a=1; b=2\nc=3\nd=4; e=5\n'
+        options = parse_args([''])
+        fixed, line_ranges = fix_line_ranges(code, [(1, 1), (3, 3)], options)
+        self.assertEqual(fixed, 'a = 1\nb = 2\nc=3\nd = 4\ne = 5\n')
+        self.assertEqual(line_ranges, [(1, 2), (4, 5)])
+
+    def test_fix_line_ranges_line_separators(self):
+        # autopep8 only splits lines on '\n' (unlike str.splitlines).
+        options = parse_args([''])
+        sep = b'\xe2\x80\xa8'.decode('utf-8')  # U+2028 LINE SEPARATOR
+        code = "x = 'a%sb'\ny=1\n" % sep
+        self.assertEqual(fix_code(code, [(2, 2)], options),
+                         "x = 'a%sb'\ny = 1\n" % sep)
+        code = 'x = 1\n\x0c\ndef f( x ):\n    return x\n'
+        self.assertEqual(fix_code(code, [(3, 3)], options),
+                         'x = 1\n\x0c\n\ndef f(x):\n    return x\n')
+
+    def test_check_line_ranges(self):
+        from pep8radius.fixer import check_line_ranges, fix_line_ranges
+        from pep8radius.ranges import LineRanges
+        code = 'a=1\nb = 2\nc = 3\nd=4\n'
+        options = parse_args([''])
+        results = check_line_ranges(code, LineRanges([(1, 3)]), options)
+        self.assertEqual([r['line'] for r in results], [1])
+        self.assertEqual(check_line_ranges(code, LineRanges([(2, 3)]),
+                                           options), [])
+        self.assertEqual(check_line_ranges(code, LineRanges([(4, 4)]),
+                                           parse_args(['--ignore=E2'])), [])
+
+        options.verbose = 1
+        with captured_output() as (out, err):
+            self.assertEqual(fix_line_ranges(code, [(2, 3)], options),
+                             (code, [(2, 3)]))
+        self.assertIn('skipping 1 of 1 line range(s)', err.getvalue())
+
+        # the pep8 options are those FixPEP8 passes (if options has them)
+        import pep8radius.fixer as fixer
+        passed = []
+        execute_pep8 = fixer._execute_pep8
+        fixer._execute_pep8 = lambda o, source: passed.append(o) or []
+        try:
+            options.hang_closing = True
+            check_line_ranges(code, LineRanges([(1, 3)]), options)
+        finally:
+            fixer._execute_pep8 = execute_pep8
+        self.assertEqual(passed[0]['hang_closing'], True)
+        self.assertEqual(passed[0]['indent_size'], options.indent_size)
+        self.assertFalse('max_doc_length' in passed[0])
+
+    def test_fix_file_in_place(self):
+        from pep8radius.radius import fix_file
+        path = os.path.join(TEMP_DIR, 'in_place.py')
+        source = b'# -*- coding: latin-1 -*-\r\na = "\xe9"\r\nb=1\r\n'
+        try:
+            with open(path, 'wb') as f:
+                f.write(source)
+            os.chmod(path, 0o751)
+            os.utime(path, (0, 0))
+
+            # Nothing to fix, so the file isn't written.
+            fix_file(path, [(2, 2)], in_place=True)
+            self.assertEqual(os.stat(path).st_mtime, 0)
+
+            fix_file(path, [(3, 3)], in_place=True)
+            with open(path, 'rb') as f:
+                self.assertEqual(f.read(), source.replace(b'b=1', b'b = 1'))
+            self.assertEqual(os.stat(path).st_mode & 0o777, 0o751)
+            self.assertEqual([f for f in os.listdir(TEMP_DIR)
+                              if f.endswith('.tmp')], [])
+        finally:
+            remove(path)
+
+    def test_fix_file_in_place_symlink(self):
+        from pep8radius.radius import fix_file
+        if not hasattr(os, 'symlink'):  # pragma: no cover
+            raise SkipTest("symlinks aren't supported")
+        path = os.path.join(TEMP_DIR, 'target.py')
+        link = os.path.join(TEMP_DIR, 'link.py')
+        try:
+            save('a=1\n', path)
+            os.symlink(path, link)
+            fix_file(link, [(1, 1)], in_place=True)
+            self.assertTrue(os.path.islink(link))
+            with open(path) as f:
+                self.assertEqual(f.read(), 'a = 1\n')
+        finally:
+            remove(link)
+            remove(path)
+
+    def test_threads(self):
+        from threading import Thread
+        options = parse_args(['--docformatter'])
+        codes = ['def f( x ):\n    return %s*x\na=%s; b=2\n' % (i, i)
+                 for i in range(20)]
+        expected = [fix_code(code, [(1, 2)], options) for code in codes]
+        results = {}
+
+        def fix(i):
+            results[i] = fix_code(codes[i], [(1, 2)], options)
+            fix_line_range(codes[i], 3, 3, options)
+        threads = [Thread(target=fix, args=(i,)) for i in range(20)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual([results[i] for i in range(20)], expected)
+        # the options passed in aren't changed
+        self.assertFalse(hasattr(options, 'line_range'))
+
+    def test_fix_blocks(self):
+        from pep8radius.fixer import enclosing_slices
+        code = ('import os\n\n\ndef f( x ):\n    return 2*x\n\n\n'
+                'def g( y ):\n    return y\n\nclass A:\n'
+                '    def h( self ):\n        return 1\n\n\n'
+                'def k( z ):\n    return z\n\n\nb=2\n')
+        line_ranges = [(5, 5), (12, 13)]
+        self.assertEqual(enclosing_slices(code, line_ranges),
+                         [(1, 17, [(5, 5), (12, 13)])])
+        self.assertEqual(enclosing_slices(code, [(5, 5)]),
+                         [(1, 9, [(5, 5)])])
+        self.assertEqual(enclosing_slices(code + 'def (', [(5, 5)]), None)
+
+        for line_ranges in [[(5, 5)], [(5, 5), (12, 13)], [(8, 9), (20, 20)],
+                            [(1, 20)], [(11, 11)]]:
+            self.assertEqual(
+                fix_code(code, line_ranges, parse_args(['--fix-blocks'])),
+                fix_code(code, line_ranges, parse_args([''])))
+
+        # the line numbers only count '\n' (as ast's and autopep8's do)
+        sep = b'\xe2\x80\xa8'.decode('utf-8')  # U+2028 LINE SEPARATOR
+        code = ("x = 'a%sb'\n\x0c\n\ndef f( x ):\n    return x\n\n\n"
+                "def g( y ):\n    return y\n" % sep)
+        self.assertEqual(enclosing_slices(code, [(4, 4)]),
+                         [(1, 9, [(4, 4)])])
+        self.assertEqual(
+            fix_code(code, [(4, 4)], parse_args(['--fix-blocks'])),
+            fix_code(code, [(4, 4)], parse_args([''])))
+
+    def test_cache(self):
+        cache_dir = os.path.join(TEMP_DIR, 'cache')
+        remove_dir(cache_dir)
+        cache = FixCache(cache_dir)
+        code = 'a=1; b=2\nc=3\n'
+        options = parse_args([''])
+        fixed = fix_code(code, [(1, 1)], options, cache=cache)
+        self.assertEqual((cache.hits, cache.misses), (0, 1))
+        self.assertEqual(fix_code(code, [(1, 1)], options, cache=cache),
+                         fixed)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+        # different line_ranges and options are different results
+        fix_code(code, [(2, 2)], options, cache=cache)
+        fix_code(code, [(1, 1)], parse_args(['--max-line-length=100']),
+                 cache=cache)
+        self.assertEqual((cache.hits, cache.misses), (1, 3))
+
+        # options which don't change the fixed code don't change the key
+        from pep8radius.cache import fingerprint
+        for args in (['--format', 'jsonl'], ['--repo', 'foo'],
+                     ['--manifest', 'repos.txt'], ['--watch'],
+                     ['--watch-interval', '2']):
+            self.assertEqual(fingerprint(parse_args(args)),
+                             fingerprint(options))
+
+        # the least recently used result is removed first
+        entries = [e for e in os.listdir(cache_dir) if e != '.gitignore']
+        self.assertEqual(len(entries), 3)
+        cache.max_size = 2 * len(fixed)
+        fix_code(code, [(1, 1)], options, cache=cache)
+        cache.prune()
+        self.assertEqual(cache.hits, 2)
+        self.assertIn(cache.key(code, [(1, 1)], options),
+                      os.listdir(cache_dir))
+        self.assertEqual(len(os.listdir(cache_dir)), 3)
+        remove_dir(cache_dir)
+
 if __name__ == '__main__':
     test_main()
@@ -0,0 +1,37 @@
+from pep8radius.ranges import LineRanges
+from tests.util import *
+
+
+class TestLineRanges(TestCase):
+
+    def test_normalize(self):
+        self.assertEqual(LineRanges([(5, 6), (1, 2), (2, 3), (0, 1)]),
+                         [(1, 3), (5, 6)])
+        self.assertEqual(LineRanges([(1, 2), (3, 4), (7, 7), (5, 4)]),
+                         [(1, 4), (7, 7)])
+        self.assertEqual(repr(LineRanges([(1, 2)])), '[(1, 2)]')
+
+    def test_gap(self):
+        ranges = LineRanges([(1, 2), (5, 6), (10, 10)])
+        self.assertEqual(ranges.merged(1), ranges)
+        self.assertEqual(ranges.merged(2), [(1, 6), (10, 10)])
+        self.assertEqual(LineRanges(ranges, gap=3), [(1, 10)])
+
+    def test_queries(self):
+        ranges = LineRanges([(3, 5), (10, 12)])
+        self.assertEqual([i for i in range(15) if i in ranges],
+                         [3, 4, 5, 10, 11, 12])
+        self.assertTrue(ranges.intersects(1, 3))
+        self.assertTrue(ranges.intersects(6, 20))
+        self.assertFalse(ranges.intersects(6, 9))
+        self.assertEqual(ranges.intersection([(1, 3), (5, 11)]),
+                         [(3, 3), (5, 5), (10, 11)])
+        self.assertEqual(ranges.intersection([]), [])
+
+    def test_fix_code_merge_gap(self):
+        code = 'a=1\nb=2\nc=3\n'
+        self.assertEqual(fix_code(code, [(1, 1), (3, 3)]),
+                         'a = 1\nb=2\nc = 3\n')
+        self.assertEqual(fix_code(code, [(1, 1), (3, 3)],
+                                  parse_args(['--merge-gap=1'])),
+                         'a = 1\nb = 2\nc = 3\n')
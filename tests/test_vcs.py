@@ -40,11 +40,114 @@ class TestRadiusNoVCS(TestCase):
         self.assertTrue(using_git(cwd=cwd))
         self.assertTrue(isinstance(Radius(vc='git').vc, Git))
 
+    def test_vc_markers(self):
+        MixinHg.delete_repo()
+        MixinBzr.delete_repo()
+        if not MixinGit.init_vc():
+            raise SkipTest("git not configured correctly")
+        self.assertEqual(vc_markers(SUBTEMP_DIR), (TEMP_DIR, ['git']))
+        self.assertEqual(VersionControl.which(cwd=SUBTEMP_DIR), Git)
+
+        # a gitfile, as used by worktrees and submodules
+        MixinGit.delete_repo()
+        gitfile = os.path.join(SUBTEMP_DIR, '.git')
+        save('gitdir: %s' % os.path.join(TEMP_DIR, 'elsewhere'), gitfile)
+        try:
+            self.assertEqual(vc_markers(SUBTEMP_DIR), (SUBTEMP_DIR, ['git']))
+        finally:
+            remove(gitfile)
+        self.assertNotEqual(vc_markers(SUBTEMP_DIR)[0], SUBTEMP_DIR)
+
 
 class TestRadiusGit(TestRadius, MixinGit, MixinTests):
     vc = 'git'
 
 
+class TestRadiusGitBatch(TestRadius, MixinGit, MixinTests):
+    vc = 'git-batch'
+
+    def test_same_as_git(self):
+        lines = ['a%s=%s\n' % (i, i) for i in range(20)]
+        original = ''.join(lines)
+        lines[3] = 'a3 = 3\n'
+        lines[16:16] = ['c=3\n']
+        del lines[-1]
+        modified = ''.join(lines)
+        save(original, 'temp.py')
+        self.successfully_commit_files(['temp.py'])
+        save(modified, 'temp.py')
+        save(modified, 'new.py')
+        self.successfully_commit_files(['new.py'], commit='new')
+        save(modified.replace('c=3', 'c = 3'), 'new.py')
+
+        r = Radius(vc='git', cwd=TEMP_DIR)
+        batch = Radius(vc='git-batch', cwd=TEMP_DIR)
+        self.assertEqual(type(batch.vc).__name__, 'GitBatch')
+        for f in r.filenames_diff:
+            self.assertEqual(batch.modified_lines(f), r.modified_lines(f))
+        self.assertEqual(batch.modified_lines(os.path.join(TEMP_DIR,
+                                                           'temp.py')),
+                         [(4, 4), (17, 17)])
+
+    def test_eol_attributes(self):
+        # git converts the newlines of temp.py when checking it out, so it
+        # can't be compared with its blob.
+        save('*.py text eol=crlf\n', '.gitattributes')
+        try:
+            save('a=1\nb=2\nc=3\n', 'temp.py')
+            self.successfully_commit_files(['.gitattributes', 'temp.py'])
+            path = os.path.join(TEMP_DIR, 'temp.py')
+            with open(path, 'wb') as f:
+                f.write(b'a=1\r\nb = 2\r\nc=3\r\n')
+
+            r = Radius(vc='git', cwd=TEMP_DIR)
+            batch = Radius(vc='git-batch', cwd=TEMP_DIR)
+            self.assertEqual(batch.modified_lines(path), [(2, 2)])
+            self.assertEqual(batch.modified_lines(path),
+                             r.modified_lines(path))
+            self.assertEqual(batch.vc.modified_lines(batch, 'temp.py'),
+                             [(2, 2)])
+        finally:
+            remove(os.path.join(TEMP_DIR, '.gitattributes'))
+
+    def test_file_at_threads(self):
+        from threading import Thread
+        file_names = ['t%s.py' % i for i in range(4)]
+        for i, file_name in enumerate(file_names):
+            save('a = %s\n' % i * 1000 * (i + 1), file_name)
+        self.successfully_commit_files(file_names)
+
+        r = Radius(vc='git-batch', cwd=TEMP_DIR)
+        wrong = []
+
+        def read(i):
+            for _ in range(20):
+                if r.vc.file_at(r.rev, file_names[i]) != ('a = %s\n' % i *
+                                                          1000 * (i + 1)):
+                    wrong.append(i)
+        threads = [Thread(target=read, args=(i % 4,)) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        r.close()
+        self.assertEqual(wrong, [])
+
+    def test_close(self):
+        save('a=1\n', 'temp.py')
+        self.successfully_commit_files(['temp.py'])
+        save('a=1\nb=2\n', 'temp.py')
+
+        r = Radius(vc='git-batch', cwd=TEMP_DIR)
+        r.fix()
+        self.assertEqual(r.vc._cat_file, None)
+
+        with r.vc as vc:
+            vc.file_at(r.rev, 'temp.py')
+            self.assertTrue(vc._cat_file is not None)
+        self.assertEqual(r.vc._cat_file, None)
+
+
 class TestRadiusHg(TestRadius, MixinHg, MixinTests):
     vc = 'hg'
 
@@ -21,13 +21,17 @@ else:
 ROOT_DIR = os.path.split(os.path.abspath(os.path.dirname(__file__)))[0]
 sys.path.insert(0, ROOT_DIR)
 from pep8radius import (Radius,
+                        fix_code,
                         shell_out,
                         parse_args,
                         version)
-from pep8radius.diff import modified_lines_from_udiff, get_diff
+from pep8radius.cache import FixCache
+from pep8radius.radius import fix_line_range
+from pep8radius.diff import (modified_lines_from_udiff, get_diff, print_diff,
+                             iter_udiff)
 from pep8radius.shell import CalledProcessError, from_dir
 from pep8radius.vcs import (VersionControl, Git, Bzr, Hg,
-                            using_git, using_hg, using_bzr)
+                            using_git, using_hg, using_bzr, vc_markers)
 
 
 PEP8RADIUS = os.path.join(ROOT_DIR, 'pep8radius', '__init__.py')